@@ -10,10 +10,13 @@ automatically tries exact centering first, but allows ±1 tolerance if needed.
 
 from layout_automation.cell import Cell
 
+# Separator lines for the console report
+SEP60 = "=" * 60
+
 # Example 1: Exact centering (should achieve exact center)
-print("=" * 60)
+print(SEP60)
 print("Example 1: Exact centering (both dimensions even)")
-print("=" * 60)
+print(SEP60)
 
 parent1 = Cell('parent1')
 poly1 = Cell('poly1', 'metal1')
@@ -49,9 +52,9 @@ if parent1.solver():
 
 
 # Example 2: Tolerance needed (odd dimension conflict)
-print("\n" + "=" * 60)
+print("\n" + SEP60)
 print("Example 2: Tolerance fallback (dimension conflict)")
-print("=" * 60)
+print(SEP60)
 
 parent2 = Cell('parent2')
 poly3 = Cell('poly3', 'metal1')
@@ -92,9 +95,9 @@ if parent2.solver():
 
 
 # Example 3: X-only centering
-print("\n" + "=" * 60)
+print("\n" + SEP60)
 print("Example 3: X-only centering with tolerance")
-print("=" * 60)
+print(SEP60)
 
 parent3 = Cell('parent3')
 poly5 = Cell('poly5', 'metal1')
@@ -124,10 +127,10 @@ if parent3.solver():
         print("✓ X-centering within ±1 tolerance achieved!")
 
 
-print("\n" + "=" * 60)
+print("\n" + SEP60)
 print("Summary:")
 print("  - 'center' keyword now automatically uses ±1 tolerance")
 print("  - Solver prefers exact centering but allows ±1 if needed")
 print("  - Uses OR-Tools native soft constraint pattern")
 print("  - Works with 'center', 'xcenter', and 'ycenter' keywords")
-print("=" * 60)
+print(SEP60)
@@ -13,16 +13,20 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from layout_automation.cell import Cell
 
-print("=" * 80)
+# Separator lines for the console report
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+print(SEP80)
 print("TESTING child_dict AND tree() FEATURES")
-print("=" * 80)
+print(SEP80)
 print()
 
 # ==============================================================================
 # TEST 1: child_dict Attribute
 # ==============================================================================
 print("TEST 1: child_dict Attribute")
-print("-" * 80)
+print(DASH80)
 print()
 
 # Create a hierarchical layout
@@ -64,7 +68,7 @@ print()
 # TEST 2: tree() Method - Without Positions
 # ==============================================================================
 print("TEST 2: tree() Method - Without Positions/Solving")
-print("-" * 80)
+print(DASH80)
 print()
 
 # Create a more complex hierarchy
@@ -88,9 +92,11 @@ for i in range(2):
 src_contacts = Cell('src_contacts_inst')
 drn_contacts = Cell('drn_contacts_inst')
 
-for child in contact_array.children:
-    src_contacts.add_instance(child.copy())
-    drn_contacts.add_instance(child.copy())
+# Materialize each side's copies once from the contact array template
+src_copies = [c.copy() for c in contact_array.children]
+drn_copies = [c.copy() for c in contact_array.children]
+src_contacts.add_instance(src_copies)
+drn_contacts.add_instance(drn_copies)
 
 transistor.add_instance([src_contacts, drn_contacts])
 
@@ -100,9 +106,8 @@ trans1 = Cell('transistor_1')
 trans2 = Cell('transistor_2')
 
 # Copy transistor structure
-for child in transistor.children:
-    trans1.add_instance(child.copy())
-    trans2.add_instance(child.copy())
+trans1.add_instance([c.copy() for c in transistor.children])
+trans2.add_instance([c.copy() for c in transistor.children])
 
 circuit.add_instance([trans1, trans2])
 
@@ -117,7 +122,7 @@ print()
 # TEST 3: tree() Method - With Positions
 # ==============================================================================
 print("TEST 3: tree() Method - With Positions and Frozen Cells")
-print("-" * 80)
+print(DASH80)
 print()
 
 # Create a simple layout with positions
@@ -159,7 +164,7 @@ print()
 # TEST 4: Accessing Specific Child via child_dict
 # ==============================================================================
 print("TEST 4: Using child_dict to Access and Modify Children")
-print("-" * 80)
+print(DASH80)
 print()
 
 # Create a cell with named children
@@ -194,7 +199,7 @@ print()
 # TEST 5: Automatic Copy Naming
 # ==============================================================================
 print("TEST 5: Automatic Copy Naming with _c{N}")
-print("-" * 80)
+print(DASH80)
 print()
 
 # Create a reusable block
@@ -238,9 +243,9 @@ print()
 # ==============================================================================
 # SUMMARY
 # ==============================================================================
-print("=" * 80)
+print(SEP80)
 print("FEATURE SUMMARY")
-print("=" * 80)
+print(SEP80)
 print()
 print("1. child_dict Attribute:")
 print("   - Dictionary mapping child names to Cell instances")
@@ -260,4 +265,4 @@ print("   - copy('custom_name') for explicit naming")
 print("   - Each copy is independent with reset constraint variables")
 print()
 print("All three features tested successfully!")
-print("=" * 80)
+print(SEP80)
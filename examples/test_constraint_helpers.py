@@ -26,12 +26,16 @@ from layout_automation.constraints import (
 # Create output directory
 os.makedirs('demo_outputs', exist_ok=True)
 
+# Separator lines for the console report
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
 
 def test_center():
     """Test centering constraints"""
-    print("=" * 80)
+    print(SEP80)
     print("TEST 1: Center Constraints")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     parent = Cell('parent')
@@ -58,9 +62,9 @@ def test_center():
 
 def test_alignment():
     """Test alignment constraints"""
-    print("=" * 80)
+    print(SEP80)
     print("TEST 2: Alignment Constraints")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     parent = Cell('parent')
@@ -102,9 +106,9 @@ def test_alignment():
 
 def test_spacing():
     """Test spacing constraints"""
-    print("=" * 80)
+    print(SEP80)
     print("TEST 3: Spacing Constraints")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     parent = Cell('parent')
@@ -142,9 +146,9 @@ def test_spacing():
 
 def test_compound():
     """Test compound constraints (beside, above, below)"""
-    print("=" * 80)
+    print(SEP80)
     print("TEST 4: Compound Constraints")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     parent = Cell('parent')
@@ -193,9 +197,9 @@ def test_compound():
 
 def test_size_matching():
     """Test size matching constraints"""
-    print("=" * 80)
+    print(SEP80)
     print("TEST 5: Size Matching")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     parent = Cell('parent')
@@ -236,9 +240,9 @@ def test_size_matching():
 
 def test_readable_layout():
     """Create a complex layout using constraint helpers for readability"""
-    print("=" * 80)
+    print(SEP80)
     print("TEST 6: Readable Complex Layout")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     # Create a simple transistor-like structure
@@ -292,13 +296,13 @@ def test_readable_layout():
 
 def compare_readability():
     """Compare old vs new constraint syntax"""
-    print("=" * 80)
+    print(SEP80)
     print("COMPARISON: Old vs New Constraint Syntax")
-    print("=" * 80)
+    print(SEP80)
     print()
 
     print("OLD SYNTAX (manual constraint strings):")
-    print("-" * 80)
+    print(DASH80)
     print("""
     # Center child in parent
     parent.constrain(child, 'sx1+sx2=ox1+ox2, sy1+sy2=oy1+oy2', parent)
@@ -315,7 +319,7 @@ def compare_readability():
 
     print()
     print("NEW SYNTAX (constraint helpers):")
-    print("-" * 80)
+    print(DASH80)
     print("""
     # Center child in parent
     parent.constrain(child, *center(parent))
@@ -349,7 +353,9 @@ def main():
     # Print reference table
     print_reference()
     print()
-    input("Press Enter to run tests...")
+    # Only pause when a user is at the terminal (not under CI / piped runs)
+    if sys.stdin.isatty():
+        input("Press Enter to run tests...")
     print()
 
     # Run tests
@@ -361,9 +367,9 @@ def main():
     test_readable_layout()
     compare_readability()
 
-    print("=" * 80)
+    print(SEP80)
     print("SUMMARY")
-    print("=" * 80)
+    print(SEP80)
     print()
     print("✓ All constraint helper tests passed")
     print()
@@ -381,7 +387,7 @@ def main():
     print()
     print("  print_reference()  # Show constraint reference table")
     print()
-    print("=" * 80)
+    print(SEP80)
 
 
 if __name__ == '__main__':
@@ -5,6 +5,7 @@ Test constraint keyword expansion
 Demonstrates the simple keyword→constraint string replacement system
 """
 
+import argparse
 import os
 import sys
 
@@ -281,6 +282,11 @@ def compare_syntax():
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Constraint keyword expansion tests')
+    parser.add_argument('--interactive', action='store_true',
+                        help='Print the keyword reference and wait for Enter before running')
+    args = parser.parse_args()
+
     print()
     print("*" * 80)
     print("CONSTRAINT KEYWORD EXPANSION TEST")
@@ -288,10 +294,11 @@ def main():
     print()
 
     # Print reference table
-    print_keyword_reference()
-    print()
-    input("Press Enter to run tests...")
-    print()
+    if args.interactive:
+        print_keyword_reference()
+        print()
+        input("Press Enter to run tests...")
+        print()
 
     # Run tests
     test_keyword_expansion()
@@ -20,6 +20,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from layout_automation.cell import Cell
 
+
+def origin_offset(cell, ref):
+    """Offset of cell's (x1, y1) from ref's (x1, y1)"""
+    p, r = cell.pos_list, ref.pos_list
+    return (p[0] - r[0], p[1] - r[1])
+
+
 def test_fix_layout():
     """
     Test that fixed layouts can be repositioned and internal elements update correctly
@@ -59,25 +66,10 @@ def test_fix_layout():
     block.fix_layout()
     print(f"   ✓ Block fixed (is_fixed={block.is_fixed()})")
 
-    # Store original positions for comparison
-    original_block = tuple(block.pos_list)
-    original_rect1 = tuple(rect1.pos_list)
-    original_rect2 = tuple(rect2.pos_list)
-    original_rect3 = tuple(rect3.pos_list)
-
     # Calculate original offsets
-    orig_rect1_offset = (
-        rect1.pos_list[0] - block.pos_list[0],
-        rect1.pos_list[1] - block.pos_list[1]
-    )
-    orig_rect2_offset = (
-        rect2.pos_list[0] - block.pos_list[0],
-        rect2.pos_list[1] - block.pos_list[1]
-    )
-    orig_rect3_offset = (
-        rect3.pos_list[0] - block.pos_list[0],
-        rect3.pos_list[1] - block.pos_list[1]
-    )
+    orig_rect1_offset = origin_offset(rect1, block)
+    orig_rect2_offset = origin_offset(rect2, block)
+    orig_rect3_offset = origin_offset(rect3, block)
 
     print(f"   Original offsets from block origin:")
     print(f"      rect1: offset=({orig_rect1_offset[0]}, {orig_rect1_offset[1]})")
@@ -102,32 +94,19 @@ def test_fix_layout():
     print(f"      rect3: {rect3.pos_list}")
 
     # 4. Verify that the block moved to the new position
-    new_block = tuple(block.pos_list)
-    new_rect1 = tuple(rect1.pos_list)
-    new_rect2 = tuple(rect2.pos_list)
-    new_rect3 = tuple(rect3.pos_list)
-
     print("\n4. Verifying positions after repositioning...")
 
     # Check block moved to correct position
-    if block.pos_list[0] != 100 or block.pos_list[1] != 50:
-        print(f"✗ Block did not move to (100, 50), got ({block.pos_list[0]}, {block.pos_list[1]})")
+    bx1, by1 = block.pos_list[0], block.pos_list[1]
+    if bx1 != 100 or by1 != 50:
+        print(f"✗ Block did not move to (100, 50), got ({bx1}, {by1})")
         return False
     print(f"   ✓ Block repositioned to (100, 50)")
 
     # Check internal rectangles updated
-    new_rect1_offset = (
-        rect1.pos_list[0] - block.pos_list[0],
-        rect1.pos_list[1] - block.pos_list[1]
-    )
-    new_rect2_offset = (
-        rect2.pos_list[0] - block.pos_list[0],
-        rect2.pos_list[1] - block.pos_list[1]
-    )
-    new_rect3_offset = (
-        rect3.pos_list[0] - block.pos_list[0],
-        rect3.pos_list[1] - block.pos_list[1]
-    )
+    new_rect1_offset = origin_offset(rect1, block)
+    new_rect2_offset = origin_offset(rect2, block)
+    new_rect3_offset = origin_offset(rect3, block)
 
     print(f"   New offsets from block origin:")
     print(f"      rect1: offset=({new_rect1_offset[0]}, {new_rect1_offset[1]})")
@@ -174,18 +153,9 @@ def test_fix_layout():
     print(f"      rect3: {rect3.pos_list}")
 
     # Verify positions again
-    final_rect1_offset = (
-        rect1.pos_list[0] - block.pos_list[0],
-        rect1.pos_list[1] - block.pos_list[1]
-    )
-    final_rect2_offset = (
-        rect2.pos_list[0] - block.pos_list[0],
-        rect2.pos_list[1] - block.pos_list[1]
-    )
-    final_rect3_offset = (
-        rect3.pos_list[0] - block.pos_list[0],
-        rect3.pos_list[1] - block.pos_list[1]
-    )
+    final_rect1_offset = origin_offset(rect1, block)
+    final_rect2_offset = origin_offset(rect2, block)
+    final_rect3_offset = origin_offset(rect3, block)
 
     if (final_rect1_offset == orig_rect1_offset and
         final_rect2_offset == orig_rect2_offset and
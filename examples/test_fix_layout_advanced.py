@@ -8,8 +8,11 @@ Tests:
 4. Edge cases and combinations
 """
 
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -33,9 +36,11 @@ def test_fix_with_copy():
     rect2 = Cell('rect2', 'poly')
 
     block.add_instance([rect1, rect2])
-    block.constrain(rect1, 'x2-x1=10, y2-y1=10')
-    block.constrain(rect2, 'sx1=ox2+2, sy1=oy1, sx2-sx1=5, sy2-sy1=10', rect1)
-    block.constrain(rect1, 'sx1=x1, sy1=y1')
+    block.constrain_many([
+        (rect1, 'x2-x1=10, y2-y1=10'),
+        (rect2, 'sx1=ox2+2, sy1=oy1, sx2-sx1=5, sy2-sy1=10', rect1),
+        (rect1, 'sx1=x1, sy1=y1'),
+    ])
 
     block.solver()
     print(f"   ✓ Block solved: {block.pos_list}")
@@ -62,9 +67,11 @@ def test_fix_with_copy():
     parent = Cell('parent')
     parent.add_instance([copy1, copy2, copy3])
 
-    parent.constrain(copy1, 'x1=0, y1=0')
-    parent.constrain(copy2, 'x1=50, y1=0')
-    parent.constrain(copy3, 'x1=0, y1=50')
+    parent.constrain_many([
+        (copy1, 'x1=0, y1=0'),
+        (copy2, 'x1=50, y1=0'),
+        (copy3, 'x1=0, y1=50'),
+    ])
 
     parent.solver()
 
@@ -78,8 +85,7 @@ def test_fix_with_copy():
     print(f"\n   Internal rectangles:")
     for copy in [copy1, copy2, copy3]:
         print(f"      {copy.name}:")
-        for child in copy.children:
-            print(f"         {child.name}: {child.pos_list}")
+        print("\n".join(f"         {c.name}: {c.pos_list}" for c in copy.children))
 
     # Verify each copy's internals updated correctly
     print("\n5. Verifying internal positions...")
@@ -87,7 +93,7 @@ def test_fix_with_copy():
 
     # Check copy1 at (0, 0)
     copy1_rect1 = copy1.children[0]
-    if copy1_rect1.pos_list[0] != 0 or copy1_rect1.pos_list[1] != 0:
+    if tuple(copy1_rect1.pos_list[:2]) != (0, 0):
         print(f"   ✗ copy1 rect1 not at origin")
         success = False
     else:
@@ -95,7 +101,7 @@ def test_fix_with_copy():
 
     # Check copy2 at (50, 0)
     copy2_rect1 = copy2.children[0]
-    if copy2_rect1.pos_list[0] != 50 or copy2_rect1.pos_list[1] != 0:
+    if tuple(copy2_rect1.pos_list[:2]) != (50, 0):
         print(f"   ✗ copy2 rect1 not at (50, 0)")
         success = False
     else:
@@ -103,7 +109,7 @@ def test_fix_with_copy():
 
     # Check copy3 at (0, 50)
     copy3_rect1 = copy3.children[0]
-    if copy3_rect1.pos_list[0] != 0 or copy3_rect1.pos_list[1] != 50:
+    if tuple(copy3_rect1.pos_list[:2]) != (0, 50):
         print(f"   ✗ copy3 rect1 not at (0, 50)")
         success = False
     else:
@@ -138,9 +144,11 @@ def test_fix_with_hierarchy():
     r2 = Cell('r2', 'poly')
 
     child_cell.add_instance([r1, r2])
-    child_cell.constrain(r1, 'x2-x1=8, y2-y1=8')
-    child_cell.constrain(r2, 'sx1=ox2+1, sy1=oy1, sx2-sx1=3, sy2-sy1=8', r1)
-    child_cell.constrain(r1, 'sx1=x1, sy1=y1')
+    child_cell.constrain_many([
+        (r1, 'x2-x1=8, y2-y1=8'),
+        (r2, 'sx1=ox2+1, sy1=oy1, sx2-sx1=3, sy2-sy1=8', r1),
+        (r1, 'sx1=x1, sy1=y1'),
+    ])
 
     child_cell.solver()
     print(f"   ✓ Child cell solved: {child_cell.pos_list}")
@@ -199,36 +207,39 @@ def test_fix_with_hierarchy():
     print("\n5. Verifying hierarchical updates...")
 
     # Parent should be at (100, 100)
-    if parent_cell.pos_list[0] != 100 or parent_cell.pos_list[1] != 100:
+    if tuple(parent_cell.pos_list[:2]) != (100, 100):
         print(f"   ✗ Parent not at (100, 100)")
         return False
     print(f"   ✓ Parent at (100, 100)")
 
     # Child_a should have moved by (100, 100)
     expected_child_a = (orig_child_a[0] + 100, orig_child_a[1] + 100)
-    if child_a.pos_list[0] != expected_child_a[0] or child_a.pos_list[1] != expected_child_a[1]:
+    child_a_origin = tuple(child_a.pos_list[:2])
+    if child_a_origin != expected_child_a:
         print(f"   ✗ child_a not at expected position")
         print(f"      Expected: ({expected_child_a[0]}, {expected_child_a[1]})")
-        print(f"      Got: ({child_a.pos_list[0]}, {child_a.pos_list[1]})")
+        print(f"      Got: ({child_a_origin[0]}, {child_a_origin[1]})")
         return False
-    print(f"   ✓ child_a moved correctly to ({child_a.pos_list[0]}, {child_a.pos_list[1]})")
+    print(f"   ✓ child_a moved correctly to ({child_a_origin[0]}, {child_a_origin[1]})")
 
     # Child_b should have moved by (100, 100)
     expected_child_b = (orig_child_b[0] + 100, orig_child_b[1] + 100)
-    if child_b.pos_list[0] != expected_child_b[0] or child_b.pos_list[1] != expected_child_b[1]:
+    child_b_origin = tuple(child_b.pos_list[:2])
+    if child_b_origin != expected_child_b:
         print(f"   ✗ child_b not at expected position")
         return False
-    print(f"   ✓ child_b moved correctly to ({child_b.pos_list[0]}, {child_b.pos_list[1]})")
+    print(f"   ✓ child_b moved correctly to ({child_b_origin[0]}, {child_b_origin[1]})")
 
     # Grandchildren (r1, r2) should also have moved
     expected_r1_a = (orig_r1_a[0] + 100, orig_r1_a[1] + 100)
     r1_a = child_a.children[0]
-    if r1_a.pos_list[0] != expected_r1_a[0] or r1_a.pos_list[1] != expected_r1_a[1]:
+    r1_a_origin = tuple(r1_a.pos_list[:2])
+    if r1_a_origin != expected_r1_a:
         print(f"   ✗ r1 in child_a not at expected position")
         print(f"      Expected: ({expected_r1_a[0]}, {expected_r1_a[1]})")
-        print(f"      Got: ({r1_a.pos_list[0]}, {r1_a.pos_list[1]})")
+        print(f"      Got: ({r1_a_origin[0]}, {r1_a_origin[1]})")
         return False
-    print(f"   ✓ Grandchild r1 moved correctly to ({r1_a.pos_list[0]}, {r1_a.pos_list[1]})")
+    print(f"   ✓ Grandchild r1 moved correctly to ({r1_a_origin[0]}, {r1_a_origin[1]})")
 
     print("\n" + "="*70)
     print("✓ TEST 2 PASSED: fix_layout works with hierarchical cells")
@@ -253,9 +264,11 @@ def test_deep_hierarchy():
     leaf2 = Cell('leaf2', 'poly')
 
     level1.add_instance([leaf1, leaf2])
-    level1.constrain(leaf1, 'x2-x1=5, y2-y1=5')
-    level1.constrain(leaf2, 'sx1=ox2+1, sy1=oy1, sx2-sx1=3, sy2-sy1=5', leaf1)
-    level1.constrain(leaf1, 'sx1=x1, sy1=y1')
+    level1.constrain_many([
+        (leaf1, 'x2-x1=5, y2-y1=5'),
+        (leaf2, 'sx1=ox2+1, sy1=oy1, sx2-sx1=3, sy2-sy1=5', leaf1),
+        (leaf1, 'sx1=x1, sy1=y1'),
+    ])
 
     level1.solver()
     print(f"   ✓ Level1 solved: {level1.pos_list}")
@@ -314,7 +327,7 @@ def test_deep_hierarchy():
     expected_leaf = (orig_leaf1[0] + 200, orig_leaf1[1] + 200)
 
     print("\n6. Verifying deep hierarchy update...")
-    if new_leaf1[0] == expected_leaf[0] and new_leaf1[1] == expected_leaf[1]:
+    if new_leaf1[:2] == expected_leaf:
         print(f"   ✓ Deepest leaf moved correctly!")
         print(f"      Expected: {expected_leaf}")
         print(f"      Got: {new_leaf1}")
@@ -333,22 +346,44 @@ def test_deep_hierarchy():
         return False
 
 
+def _run_captured(test_func):
+    """Run one test in a worker process, returning (passed, captured output)"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            passed = test_func()
+    except Exception as exc:
+        # Keep the output printed before the failure for the main process
+        exc.captured_output = buffer.getvalue()
+        raise
+    return passed, buffer.getvalue()
+
+
 def run_all_tests():
     """Run all advanced tests"""
     print("\n" + "="*70)
     print("ADVANCED TESTS FOR fix_layout")
     print("="*70)
 
-    results = []
-
-    # Test 1: copy()
-    results.append(("fix_layout with copy()", test_fix_with_copy()))
-
-    # Test 2: hierarchy
-    results.append(("fix_layout with hierarchy", test_fix_with_hierarchy()))
+    tests = [
+        ("fix_layout with copy()", test_fix_with_copy),
+        ("fix_layout with hierarchy", test_fix_with_hierarchy),
+        ("fix_layout with deep hierarchy", test_deep_hierarchy),
+    ]
 
-    # Test 3: deep hierarchy
-    results.append(("fix_layout with deep hierarchy", test_deep_hierarchy()))
+    # The tests share no state, so run them in parallel and print each
+    # test's captured output in the original order
+    results = []
+    with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [(name, executor.submit(_run_captured, func)) for name, func in tests]
+        for name, future in futures:
+            try:
+                passed, output = future.result()
+            except Exception as exc:
+                print(getattr(exc, 'captured_output', ''), end="")
+                raise
+            print(output, end="")
+            results.append((name, passed))
 
     # Summary
     print("\n" + "="*70)
@@ -54,8 +54,7 @@ def test_freeze_layout():
     block = create_test_block('frozen_block')
     print(f"\n1. Original block position: {block.pos_list}")
     print(f"   Internal rectangles:")
-    for child in block.children:
-        print(f"      {child.name}: {child.pos_list}")
+    print("\n".join(f"      {c.name}: {c.pos_list}" for c in block.children))
 
     # Freeze the block
     print(f"\n2. Freezing block...")
@@ -78,8 +77,7 @@ def test_freeze_layout():
 
     print(f"   ✓ Block position: {block.pos_list}")
     print(f"   Internal rectangles (still at original positions):")
-    for child in block.children:
-        print(f"      {child.name}: {child.pos_list}")
+    print("\n".join(f"      {c.name}: {c.pos_list}" for c in block.children))
 
     print("\n   Key observation:")
     print("   - Block bbox moved to (100, 50)")
@@ -97,8 +95,7 @@ def test_fix_layout():
     block = create_test_block('fixed_block')
     print(f"\n1. Original block position: {block.pos_list}")
     print(f"   Internal rectangles:")
-    for child in block.children:
-        print(f"      {child.name}: {child.pos_list}")
+    print("\n".join(f"      {c.name}: {c.pos_list}" for c in block.children))
 
     # Fix the layout
     print(f"\n2. Fixing block...")
@@ -116,8 +113,7 @@ def test_fix_layout():
 
     print(f"   ✓ Block position: {block.pos_list}")
     print(f"   Internal rectangles (updated automatically!):")
-    for child in block.children:
-        print(f"      {child.name}: {child.pos_list}")
+    print("\n".join(f"      {c.name}: {c.pos_list}" for c in block.children))
 
     print("\n   Key observation:")
     print("   - Block moved to (100, 50)")
@@ -169,14 +165,12 @@ def test_comparison():
     print("\n   FROZEN BLOCK:")
     print(f"      Block bbox: {frozen_block.pos_list}")
     print(f"      Internal rectangles (not updated):")
-    for child in frozen_block.children:
-        print(f"         {child.name}: {child.pos_list}")
+    print("\n".join(f"         {c.name}: {c.pos_list}" for c in frozen_block.children))
 
     print("\n   FIXED BLOCK:")
     print(f"      Block bbox: {fixed_block.pos_list}")
     print(f"      Internal rectangles (automatically updated!):")
-    for child in fixed_block.children:
-        print(f"         {child.name}: {child.pos_list}")
+    print("\n".join(f"         {c.name}: {c.pos_list}" for c in fixed_block.children))
 
     print("\n" + "="*70)
     print("SUMMARY")
@@ -11,10 +11,13 @@ Verification:
 - Test with increasing complexity (2x2, 4x4, 8x8 arrays)
 """
 
+import argparse
 import os
 import sys
 import time
 
+import numpy as np
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -29,76 +32,118 @@ def create_base_cell(name):
     r3 = Cell(f'{name}_r3', 'metal1')
 
     cell.add_instance([r1, r2, r3])
-    cell.constrain(r1, 'x2-x1=10, y2-y1=10')
-    cell.constrain(r2, 'sx1=ox2+2, sy1=oy1, sx2-sx1=5, sy2-sy1=10', r1)
-    cell.constrain(r3, 'sx1=ox1, sy1=oy2+2, sx2-sx1=17, sy2-sy1=5', r1)
-    cell.constrain(r1, 'sx1=x1, sy1=y1')
+    cell.constrain_many([
+        (r1, 'x2-x1=10, y2-y1=10'),
+        (r2, 'sx1=ox2+2, sy1=oy1, sx2-sx1=5, sy2-sy1=10', r1),
+        (r3, 'sx1=ox1, sy1=oy2+2, sx2-sx1=17, sy2-sy1=5', r1),
+        (r1, 'sx1=x1, sy1=y1'),
+    ])
 
     return cell
 
 
+def solved_template():
+    """
+    Build, solve and fix the template cell
+
+    The template geometry is the same for every array size, so main() builds
+    it once and every configuration copies from that fixed instance.
+
+    Returns:
+        (template, seconds spent building, solving and fixing it)
+    """
+    start_ns = time.perf_counter_ns()
+    template = create_base_cell('template')
+    template.solver()
+    template.fix_layout()
+    return template, (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def grid_coordinates(rows, cols, spacing):
+    """Return the column x and row y origins of an array, computed once"""
+    return [col * spacing for col in range(cols)], [row * spacing for row in range(rows)]
+
+
 def collect_all_positions(cell, prefix=""):
-    """Recursively collect all cell and polygon positions"""
-    positions = {}
+    """Collect all cell and polygon positions (depth-first, parents first)"""
+    # Gather (path, position) pairs and build the dict once at its final size
+    pairs = []
+    stack = [(cell, prefix)]
 
-    # Add this cell's position
-    if hasattr(cell, 'pos_list') and all(v is not None for v in cell.pos_list):
-        positions[f"{prefix}{cell.name}"] = tuple(cell.pos_list)
+    while stack:
+        cell, prefix = stack.pop()
+        pos = cell.pos_list
+        path = f"{prefix}{cell.name}"
 
-    # Recursively collect children
-    if hasattr(cell, 'children'):
-        for child in cell.children:
-            if not child.is_leaf or (hasattr(child, 'pos_list') and all(v is not None for v in child.pos_list)):
-                child_positions = collect_all_positions(child, f"{prefix}{cell.name}.")
-                positions.update(child_positions)
+        # Add this cell's position
+        if None not in pos:
+            pairs.append((path, tuple(pos)))
 
-    return positions
+        # Visit children in order; skip unplaced leaves
+        child_prefix = path + "."
+        for child in reversed(cell.children):
+            if not child.is_leaf or None not in child.pos_list:
+                stack.append((child, child_prefix))
 
+    return dict(pairs)
 
-def test_original_approach(rows, cols, spacing):
+
+def test_original_approach(rows, cols, spacing, top=None):
     """
     Original approach: Create unique cells for each position and solve the entire hierarchy
+
+    Every cell is only pinned by its x1/y1, shares no constraint with the
+    others, and is rigid (fixed-size rects chained by equalities), so solver()
+    takes its independent-placement fast path here: each cell is solved on
+    its own and moved into place, instead of one model for the whole array.
+
+    If top is given, cells already placed in it by a smaller configuration
+    are kept and only the missing grid positions are added.
     """
     print(f"\n{'='*70}")
     print(f"ORIGINAL APPROACH: {rows}x{cols} array")
     print(f"{'='*70}")
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     # Create top-level cell
-    top = Cell('top_original')
+    if top is None:
+        top = Cell('top_original')
 
-    # Create array of cells
+    # Create array of cells, reusing those already in top
+    xs, ys = grid_coordinates(rows, cols, spacing)
     cells = []
-    for row in range(rows):
+    new_cells = []
+    for row, y in enumerate(ys):
         row_cells = []
-        for col in range(cols):
-            # Create a unique cell for each position
-            cell = create_base_cell(f'cell_r{row}_c{col}')
-            top.add_instance(cell)
-
-            # Calculate position
-            x = col * spacing
-            y = row * spacing
-
-            # Add constraint for position
-            top.constrain(cell, f'x1={x}, y1={y}')
-
+        for col, x in enumerate(xs):
+            name = f'cell_r{row}_c{col}'
+            cell = top.child_dict.get(name)
+            if cell is None:
+                # Create a unique cell for each position
+                cell = create_base_cell(name)
+                new_cells.append((cell, x, y))
             row_cells.append(cell)
         cells.append(row_cells)
+    top.add_instance([cell for cell, _, _ in new_cells])
 
-    creation_time = time.time() - start_time
-    print(f"   Cell creation time: {creation_time:.4f}s")
+    # Add constraint for each new position
+    for cell, x, y in new_cells:
+        top.add_absolute_position(cell, x, y)
+
+    creation_time = (time.perf_counter_ns() - start_ns) / 1e9
 
     # Solve the entire hierarchy
-    solve_start = time.time()
+    solve_start_ns = time.perf_counter_ns()
     success = top.solver()
-    solve_time = time.time() - solve_start
+    solve_time = (time.perf_counter_ns() - solve_start_ns) / 1e9
 
-    total_time = time.time() - start_time
+    total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
-    print(f"   Solve time: {solve_time:.4f}s")
-    print(f"   Total time: {total_time:.4f}s")
+    # Report only after the timers stop, so console output is not timed
+    print(f"   Cell creation time: {creation_time:.6f}s")
+    print(f"   Solve time: {solve_time:.6f}s (independent-placement fast path: one small solve per cell)")
+    print(f"   Total time: {total_time:.6f}s")
     print(f"   Solver status: {'✓ SUCCESS' if success else '✗ FAILED'}")
 
     if not success:
@@ -111,50 +156,53 @@ def test_original_approach(rows, cols, spacing):
     return cells, positions, total_time
 
 
-def test_fix_layout_approach(rows, cols, spacing):
+def test_fix_layout_approach(rows, cols, spacing, template, template_time, top=None):
     """
     Fix layout approach: Create once, fix, then copy and position manually
+
+    The fixed template is built once by main(); its measured build time is
+    charged to every configuration, so each size is compared as if it had
+    built its own template.
+
+    If top is given, only the grid positions it does not hold yet are copied.
     """
     print(f"\n{'='*70}")
     print(f"FIX_LAYOUT APPROACH: {rows}x{cols} array")
     print(f"{'='*70}")
 
-    start_time = time.time()
-
-    # Create template cell once and fix it
-    template = create_base_cell('template')
-    template.solver()
-    template.fix_layout()
-
-    template_time = time.time() - start_time
-    print(f"   Template creation and fix time: {template_time:.4f}s")
-
     # Create top-level cell
-    top = Cell('top_fixed')
+    if top is None:
+        top = Cell('top_fixed')
 
     # Create array by copying and positioning
-    copy_start = time.time()
+    copy_start_ns = time.perf_counter_ns()
+    xs, ys = grid_coordinates(rows, cols, spacing)
     cells = []
-    for row in range(rows):
+    new_cells = []
+    for row, y in enumerate(ys):
         row_cells = []
-        for col in range(cols):
-            # Copy the fixed template
-            cell = template.copy(f'cell_r{row}_c{col}')
-            top.add_instance(cell)
+        for col, x in enumerate(xs):
+            name = f'cell_r{row}_c{col}'
+            cell = top.child_dict.get(name)
+            if cell is None:
+                # Copy the fixed template
+                cell = template.copy(name)
 
-            # Calculate and set position directly (no solver needed!)
-            x = col * spacing
-            y = row * spacing
-            cell.set_position(x, y)
+                # Set position directly (no solver needed!)
+                cell.set_position(x, y)
+                new_cells.append(cell)
 
             row_cells.append(cell)
         cells.append(row_cells)
+    top.add_instance(new_cells)
 
-    copy_time = time.time() - copy_start
-    total_time = time.time() - start_time
+    copy_time = (time.perf_counter_ns() - copy_start_ns) / 1e9
+    total_time = template_time + copy_time
 
-    print(f"   Copy and position time: {copy_time:.4f}s")
-    print(f"   Total time: {total_time:.4f}s")
+    # Report only after the timers stop, so console output is not timed
+    print(f"   Template creation and fix time: {template_time:.6f}s (built once, charged to every size)")
+    print(f"   Copy and position time: {copy_time:.6f}s")
+    print(f"   Total time: {total_time:.6f}s")
     print(f"   No solver needed! ✓")
 
     # Collect all positions
@@ -200,19 +248,15 @@ def compare_positions(orig_positions, fixed_positions, tolerance=1e-9):
     if fixed_only:
         print(f"   ⚠ Objects only in fixed: {len(fixed_only)}")
 
-    # Compare positions for common objects
-    mismatches = []
-    matches = 0
+    # Compare positions for common objects in one array operation
+    keys = sorted(common_keys)
+    orig_array = np.array([orig_norm[key] for key in keys], dtype=float).reshape(-1, 4)
+    fixed_array = np.array([fixed_norm[key] for key in keys], dtype=float).reshape(-1, 4)
+    max_diff = np.abs(orig_array - fixed_array).max(axis=1, initial=0.0)
 
-    for key in sorted(common_keys):
-        orig_pos = orig_norm[key]
-        fixed_pos = fixed_norm[key]
-
-        # Check if positions match within tolerance
-        if all(abs(o - f) < tolerance for o, f in zip(orig_pos, fixed_pos)):
-            matches += 1
-        else:
-            mismatches.append((key, orig_pos, fixed_pos))
+    mismatches = [(keys[i], orig_norm[keys[i]], fixed_norm[keys[i]])
+                  for i in np.flatnonzero(max_diff >= tolerance)]
+    matches = len(keys) - len(mismatches)
 
     print(f"\n   Exact matches: {matches}/{len(common_keys)}")
 
@@ -230,21 +274,31 @@ def compare_positions(orig_positions, fixed_positions, tolerance=1e-9):
         return True
 
 
-def run_comparison(rows, cols, spacing=30):
-    """Run comparison for a specific array size"""
+def run_comparison(rows, cols, template, template_time, spacing=30, tops=None):
+    """
+    Run comparison for a specific array size
+
+    tops is an optional (top_original, top_fixed) pair kept across calls.
+    The fixed approach then only copies the instances added since the
+    previous size, while the original approach still re-solves every cell
+    of its growing top cell, so its times stay cumulative.
+    """
+    top_orig, top_fixed = tops if tops else (None, None)
+
     print(f"\n{'#'*70}")
     print(f"# COMPARISON: {rows}x{cols} Array (spacing={spacing})")
     print(f"{'#'*70}")
 
     # Test original approach
-    orig_cells, orig_positions, orig_time = test_original_approach(rows, cols, spacing)
+    orig_cells, orig_positions, orig_time = test_original_approach(rows, cols, spacing, top_orig)
 
     if orig_positions is None:
         print("\n✗ Original approach failed, skipping comparison")
         return None
 
     # Test fix_layout approach
-    fixed_cells, fixed_positions, fixed_time = test_fix_layout_approach(rows, cols, spacing)
+    fixed_cells, fixed_positions, fixed_time = test_fix_layout_approach(
+        rows, cols, spacing, template, template_time, top_fixed)
 
     # Compare positions
     match = compare_positions(orig_positions, fixed_positions)
@@ -253,8 +307,8 @@ def run_comparison(rows, cols, spacing=30):
     print(f"\n{'='*70}")
     print("PERFORMANCE COMPARISON")
     print(f"{'='*70}")
-    print(f"   Original approach:   {orig_time:.4f}s")
-    print(f"   Fix layout approach: {fixed_time:.4f}s")
+    print(f"   Original approach:   {orig_time:.6f}s")
+    print(f"   Fix layout approach: {fixed_time:.6f}s")
 
     if fixed_time < orig_time:
         speedup = orig_time / fixed_time
@@ -273,8 +327,13 @@ def run_comparison(rows, cols, spacing=30):
     }
 
 
-def main():
-    """Run comprehensive comparison tests"""
+def main(incremental=False):
+    """
+    Run comprehensive comparison tests
+
+    With incremental=True each approach grows one persistent top cell from
+    configuration to configuration instead of rebuilding it.
+    """
     print(f"\n{'#'*70}")
     print("# FIX_LAYOUT vs ORIGINAL: COMPREHENSIVE COMPARISON")
     print(f"{'#'*70}")
@@ -288,9 +347,14 @@ def main():
     ]
 
     results = []
+    tops = (Cell('top_original'), Cell('top_fixed')) if incremental else None
+
+    # One fixed template serves every size; its cost is added to each one
+    template, template_time = solved_template()
+    print(f"\nTemplate creation and fix time: {template_time:.6f}s (measured once)")
 
     for rows, cols, spacing in test_configs:
-        result = run_comparison(rows, cols, spacing)
+        result = run_comparison(rows, cols, template, template_time, spacing, tops)
         if result:
             results.append(result)
 
@@ -304,8 +368,8 @@ def main():
 
     for r in results:
         size = f"{r['rows']}x{r['cols']}"
-        orig_time = f"{r['orig_time']:.4f}s"
-        fixed_time = f"{r['fixed_time']:.4f}s"
+        orig_time = f"{r['orig_time']:.6f}s"
+        fixed_time = f"{r['fixed_time']:.6f}s"
         speedup = f"{r['speedup']:.2f}x"
         match = "✓ YES" if r['match'] else "✗ NO"
 
@@ -328,5 +392,11 @@ def main():
 
 
 if __name__ == '__main__':
-    success = main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--incremental', action='store_true',
+                        help='grow one top cell per approach across array sizes '
+                             '(fixed approach copies only the added instances; the '
+                             'original approach still re-solves the whole top cell)')
+    args = parser.parse_args()
+    success = main(incremental=args.incremental)
     sys.exit(0 if success else 1)
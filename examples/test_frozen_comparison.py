@@ -7,93 +7,162 @@ This test verifies that:
 2. Frozen approach is significantly faster for complex hierarchies
 """
 
+import argparse
+import io
+import json
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from layout_automation.cell import Cell
+from layout_automation.cell import Cell, COORD_MAX
 
 # Create output directory
 os.makedirs('demo_outputs', exist_ok=True)
 
 
-def create_complex_block(name, num_layers=20):
-    """Create a block with many children"""
+def create_complex_block(name, num_layers=20, x_offset=0):
+    """Create a block with many children, its first layer starting at x_offset"""
     block = Cell(name)
 
-    for i in range(num_layers):
-        layer = Cell(f'{name}_layer_{i}', 'metal1')
-        block.constrain(layer, f'x1={i*3}, y1=0, x2={i*3+2}, y2=10')
+    layers = [Cell(f'{name}_layer_{i}', 'metal1') for i in range(num_layers)]
+    block.constrain_many([
+        (layer, f'x1={x_offset+i*3}, y1=0, x2={x_offset+i*3+2}, y2=10')
+        for i, layer in enumerate(layers)
+    ])
 
     return block
 
 
-def create_hierarchy_with_frozen(num_blocks=10):
+def block_pitch(layers_per_block):
+    """Return the x distance between neighbouring block instances"""
+    # 70 for the default 20 layers; wider blocks get a 10 unit gap
+    return max(70, layers_per_block * 3 + 10)
+
+
+def create_hierarchy_with_frozen(num_blocks=10, layers_per_block=20):
     """Create hierarchy using frozen blocks"""
     # Create and freeze the reusable block
-    template = create_complex_block('frozen_template', num_layers=20)
+    template = create_complex_block('frozen_template', num_layers=layers_per_block)
 
-    start_solve_template = time.time()
+    start_solve_template_ns = time.perf_counter_ns()
     if not template.solver():
         raise RuntimeError("Template solve failed")
-    solve_template_time = time.time() - start_solve_template
+    solve_template_time = (time.perf_counter_ns() - start_solve_template_ns) / 1e9
 
     template.freeze_layout()
 
     # Create parent with multiple instances of frozen block
     parent = Cell('parent_with_frozen')
 
+    instances = []
     for i in range(num_blocks):
         inst = template.copy()
         inst.name = f'frozen_inst_{i}'
-        parent.add_instance(inst)
-        # Get template size from bbox
-        bbox = template.get_bbox()
-        width = bbox[2] - bbox[0]
-        height = bbox[3] - bbox[1]
-        parent.constrain(inst, f'x1={i*70}, y1=0, x2={i*70+width}, y2={height}')
+        instances.append(inst)
+    parent.add_instance(instances)
+
+    # Frozen instances keep the template size, so pinning the lower-left
+    # corner places them completely
+    pitch = block_pitch(layers_per_block)
+    for i, inst in enumerate(instances):
+        parent.add_absolute_position(inst, i * pitch, 0)
 
     # Solve parent
-    start_solve_parent = time.time()
+    start_solve_parent_ns = time.perf_counter_ns()
     if not parent.solver():
         raise RuntimeError("Parent solve failed")
-    solve_parent_time = time.time() - start_solve_parent
+    solve_parent_time = (time.perf_counter_ns() - start_solve_parent_ns) / 1e9
 
     total_time = solve_template_time + solve_parent_time
 
     return parent, total_time, solve_template_time, solve_parent_time
 
 
-def create_hierarchy_without_frozen(num_blocks=10):
+def create_hierarchy_without_frozen(num_blocks=10, layers_per_block=20):
     """Create hierarchy without freezing (traditional approach)"""
     # Create parent with multiple blocks (not frozen)
     parent = Cell('parent_without_frozen')
+    pitch = block_pitch(layers_per_block)
 
     for i in range(num_blocks):
-        # Create a new block for each instance
-        block = create_complex_block(f'unfrozen_block_{i}', num_layers=20)
+        # Create a new block for each instance, with its layers already
+        # placed at the block's final x offset
+        block = create_complex_block(f'unfrozen_block_{i}', num_layers=layers_per_block,
+                                     x_offset=i*pitch)
         parent.add_instance(block)
 
-        # Add constraints for this block
-        for j, layer in enumerate(block.children):
-            block.constrain(layer, f'x1={i*70+j*3}, y1=0, x2={i*70+j*3+2}, y2=10')
-
     # Solve parent (solves everything at once)
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     if not parent.solver():
         raise RuntimeError("Parent solve failed")
-    solve_time = time.time() - start_time
+    solve_time = (time.perf_counter_ns() - start_ns) / 1e9
 
     return parent, solve_time
 
 
-def compare_layouts(frozen_cell, unfrozen_cell):
+def warm_up_solver():
+    """
+    Solve a tiny two-cell layout so one-time solver setup (OR-Tools load,
+    CP-SAT initialization) is not charged to the first timed solve
+    """
+    warmup = Cell('__warmup__')
+    a = Cell('__warmup_a__', 'metal1')
+    b = Cell('__warmup_b__', 'metal1')
+    warmup.constrain(a, 'x1=0, y1=0, x2=10, y2=10')
+    # A relative constraint keeps this off the solver's direct-placement paths
+    warmup.constrain(b, 'sx1=ox2+5, sy1=oy1, swidth=10, sheight=10', a)
+    with redirect_stdout(io.StringIO()):
+        warmup.solver()
+
+
+def _timed_build(build_func, num_blocks, layers_per_block):
+    """Run a hierarchy build in a worker process, returning (result, wall time, captured output)"""
+    warm_up_solver()
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            start_ns = time.perf_counter_ns()
+            result = build_func(num_blocks, layers_per_block)
+            wall_time = (time.perf_counter_ns() - start_ns) / 1e9
+    except Exception as exc:
+        # Keep the output printed before the failure for the main process
+        exc.captured_output = buffer.getvalue()
+        raise
+    return result, wall_time, buffer.getvalue()
+
+
+def _collect_build(future):
+    """Wait for a worker build and print its output, returning (result, wall time)"""
+    try:
+        result, wall_time, output = future.result()
+    except Exception as exc:
+        print(getattr(exc, 'captured_output', ''), end="")
+        raise
+    print(output, end="")
+    return result, wall_time
+
+
+def child_positions(cell):
+    """Return the children's pos_lists as an (N, 4) array, one row per child"""
+    return np.array([c.pos_list for c in cell.children], dtype=float).reshape(-1, 4)
+
+
+def compare_layouts(frozen_cell, unfrozen_cell, frozen_pos=None, unfrozen_pos=None):
     """
     Compare two cell hierarchies to verify they have the same structure and positions
 
+    Args:
+        frozen_cell, unfrozen_cell: Parents whose children are compared
+        frozen_pos, unfrozen_pos: Optional child_positions() of the two
+                                  parents, if the caller already has them
+
     Returns:
         (bool, str): (layouts_match, difference_message)
     """
@@ -104,8 +173,29 @@ def compare_layouts(frozen_cell, unfrozen_cell):
         differences.append(f"Different number of children: {len(frozen_cell.children)} vs {len(unfrozen_cell.children)}")
         return False, "\n".join(differences)
 
-    # Compare each child's position and size
-    for i in range(len(frozen_cell.children)):
+    # Flag children that differ using whole-array operations (one row per child)
+    if frozen_pos is None:
+        frozen_pos = child_positions(frozen_cell)
+    if unfrozen_pos is None:
+        unfrozen_pos = child_positions(unfrozen_cell)
+
+    # Sizes should be identical
+    size_differs = ((frozen_pos[:, 2:] - frozen_pos[:, :2]) !=
+                    (unfrozen_pos[:, 2:] - unfrozen_pos[:, :2])).any(axis=1)
+
+    # First block should be at the same x; later ones need consistent spacing
+    # (allow small tolerance for solver differences)
+    x_differs = np.zeros(len(frozen_pos), dtype=bool)
+    x_differs[:1] = frozen_pos[:1, 0] != unfrozen_pos[:1, 0]
+    frozen_spacings = frozen_pos[1:, 0] - frozen_pos[:-1, 2]
+    unfrozen_spacings = unfrozen_pos[1:, 0] - unfrozen_pos[:-1, 2]
+    x_differs[1:] = np.abs(frozen_spacings - unfrozen_spacings) > 1
+
+    # Y positions should match
+    y_differs = (frozen_pos[:, [1, 3]] != unfrozen_pos[:, [1, 3]]).any(axis=1)
+
+    # Describe each flagged child
+    for i in np.flatnonzero(size_differs | x_differs | y_differs):
         frozen_child = frozen_cell.children[i]
         unfrozen_child = unfrozen_cell.children[i]
 
@@ -154,7 +244,29 @@ def compare_layouts(frozen_cell, unfrozen_cell):
     return True, "Layouts are identical"
 
 
-def main():
+def _write_metrics(path, metrics):
+    """Write the run's metrics dictionary to a JSON file"""
+    with open(path, 'w') as f:
+        json.dump(metrics, f, indent=2)
+    print(f"Metrics written to {path}")
+
+
+def main(num_blocks=10, layers_per_block=20, frozen_only=False, skip_export=False,
+         parallel=False, json_out=None):
+    """
+    Run the comparison
+
+    Args:
+        num_blocks: Number of block instances in each hierarchy
+        layers_per_block: Number of layer rectangles in each block
+        frozen_only: Only build and time the frozen hierarchy (TEST 1)
+        skip_export: Skip GDS export and tree printing
+        parallel: Build the two hierarchies at the same time in worker
+                  processes (shorter wall time, but the builds compete for
+                  CPU, which skews the solve times being compared)
+        json_out: Optional path for a JSON file with the timings, cell counts
+                  and comparison result
+    """
     print("=" * 80)
     print("FROZEN VS NON-FROZEN LAYOUT COMPARISON TEST")
     print("=" * 80)
@@ -166,10 +278,6 @@ def main():
     print("  2. Runtime performance (solve time)")
     print()
 
-    # Configuration
-    num_blocks = 10
-    layers_per_block = 20
-
     print(f"Configuration:")
     print(f"  Number of block instances: {num_blocks}")
     print(f"  Layers per block: {layers_per_block}")
@@ -177,6 +285,29 @@ def main():
     print(f"  Total cells with freeze: {1 + num_blocks} (template children excluded)")
     print()
 
+    builds = [create_hierarchy_with_frozen]
+    if not frozen_only:
+        builds.append(create_hierarchy_without_frozen)
+
+    # The two hierarchies share nothing, so they can be built in parallel
+    # worker processes; each test section below then waits for its build
+    # and prints the build's captured output
+    futures = []
+    if parallel:
+        executor = ProcessPoolExecutor(max_workers=len(builds))
+        futures = [executor.submit(_timed_build, build, num_blocks, layers_per_block) for build in builds]
+        executor.shutdown(wait=False)
+    else:
+        warm_up_solver()
+
+    def run_build(index):
+        """Return (result, wall time) of build number index"""
+        if futures:
+            return _collect_build(futures[index])
+        start_ns = time.perf_counter_ns()
+        result = builds[index](num_blocks, layers_per_block)
+        return result, (time.perf_counter_ns() - start_ns) / 1e9
+
     # ==============================================================================
     # TEST 1: Create hierarchy WITH frozen cells
     # ==============================================================================
@@ -186,33 +317,50 @@ def main():
     print()
 
     print("Creating hierarchy with frozen blocks...")
-    frozen_start = time.time()
-    frozen_parent, frozen_total_time, frozen_template_time, frozen_parent_time = create_hierarchy_with_frozen(num_blocks)
-    frozen_end = time.time()
-    frozen_wall_time = frozen_end - frozen_start
+    frozen_result, frozen_wall_time = run_build(0)
+    frozen_parent, frozen_total_time, frozen_template_time, frozen_parent_time = frozen_result
 
     print(f"✓ Frozen hierarchy created")
-    print(f"  Template solve time: {frozen_template_time:.4f}s")
-    print(f"  Parent solve time: {frozen_parent_time:.4f}s")
-    print(f"  Total solve time: {frozen_total_time:.4f}s")
-    print(f"  Wall clock time: {frozen_wall_time:.4f}s")
+    print(f"  Template solve time: {frozen_template_time:.6f}s")
+    print(f"  Parent solve time: {frozen_parent_time:.6f}s")
+    print(f"  Total solve time: {frozen_total_time:.6f}s")
+    print(f"  Wall clock time: {frozen_wall_time:.6f}s")
     print()
 
     # Check number of cells in solver
-    frozen_cells_count = len(frozen_parent._get_all_cells())
+    frozen_cells_count = frozen_parent.count_cells()
     print(f"  Cells in parent solver: {frozen_cells_count}")
     print()
 
-    # Export
+    metrics = {
+        'num_blocks': num_blocks,
+        'layers_per_block': layers_per_block,
+        'frozen_template_time_s': frozen_template_time,
+        'frozen_parent_time_s': frozen_parent_time,
+        'frozen_total_time_s': frozen_total_time,
+        'frozen_wall_time_s': frozen_wall_time,
+        'frozen_cells': frozen_cells_count,
+    }
+
     frozen_gds = 'demo_outputs/comparison_frozen.gds'
-    frozen_parent.export_gds(frozen_gds)
-    print(f"✓ Exported to {frozen_gds}")
-    print()
+    if not skip_export:
+        # Export
+        frozen_parent.export_gds(frozen_gds)
+        print(f"✓ Exported to {frozen_gds}")
+        print()
 
-    # Display structure
-    print("Frozen hierarchy structure:")
-    frozen_parent.tree(show_positions=True, show_layers=False)
-    print()
+        # Display structure
+        print("Frozen hierarchy structure:")
+        frozen_parent.tree(show_positions=True, show_layers=False)
+        print()
+
+    if frozen_only:
+        print("Frozen-only run: skipping the non-frozen build and comparisons")
+        print()
+        if json_out:
+            _write_metrics(json_out, metrics)
+        print("=" * 80)
+        return True
 
     # ==============================================================================
     # TEST 2: Create hierarchy WITHOUT frozen cells
@@ -223,31 +371,29 @@ def main():
     print()
 
     print("Creating hierarchy without frozen blocks...")
-    unfrozen_start = time.time()
-    unfrozen_parent, unfrozen_total_time = create_hierarchy_without_frozen(num_blocks)
-    unfrozen_end = time.time()
-    unfrozen_wall_time = unfrozen_end - unfrozen_start
+    (unfrozen_parent, unfrozen_total_time), unfrozen_wall_time = run_build(1)
 
     print(f"✓ Non-frozen hierarchy created")
-    print(f"  Total solve time: {unfrozen_total_time:.4f}s")
-    print(f"  Wall clock time: {unfrozen_wall_time:.4f}s")
+    print(f"  Total solve time: {unfrozen_total_time:.6f}s")
+    print(f"  Wall clock time: {unfrozen_wall_time:.6f}s")
     print()
 
     # Check number of cells in solver
-    unfrozen_cells_count = len(unfrozen_parent._get_all_cells())
+    unfrozen_cells_count = unfrozen_parent.count_cells()
     print(f"  Cells in solver: {unfrozen_cells_count}")
     print()
 
-    # Export
     unfrozen_gds = 'demo_outputs/comparison_unfrozen.gds'
-    unfrozen_parent.export_gds(unfrozen_gds)
-    print(f"✓ Exported to {unfrozen_gds}")
-    print()
+    if not skip_export:
+        # Export
+        unfrozen_parent.export_gds(unfrozen_gds)
+        print(f"✓ Exported to {unfrozen_gds}")
+        print()
 
-    # Display structure
-    print("Non-frozen hierarchy structure:")
-    unfrozen_parent.tree(show_positions=True, show_layers=False)
-    print()
+        # Display structure
+        print("Non-frozen hierarchy structure:")
+        unfrozen_parent.tree(show_positions=True, show_layers=False)
+        print()
 
     # ==============================================================================
     # TEST 3: Compare layouts
@@ -257,7 +403,12 @@ def main():
     print("=" * 80)
     print()
 
-    layouts_match, message = compare_layouts(frozen_parent, unfrozen_parent)
+    # Child positions, shared by the comparison and the detailed report
+    frozen_pos = child_positions(frozen_parent)
+    unfrozen_pos = child_positions(unfrozen_parent)
+
+    layouts_match, message = compare_layouts(frozen_parent, unfrozen_parent,
+                                             frozen_pos, unfrozen_pos)
 
     if layouts_match:
         print("✓ LAYOUTS ARE IDENTICAL")
@@ -285,10 +436,10 @@ def main():
     print()
 
     print(f"Solve time comparison:")
-    print(f"  Frozen approach: {frozen_total_time:.4f}s")
-    print(f"    - Template: {frozen_template_time:.4f}s")
-    print(f"    - Parent: {frozen_parent_time:.4f}s")
-    print(f"  Non-frozen approach: {unfrozen_total_time:.4f}s")
+    print(f"  Frozen approach: {frozen_total_time:.6f}s")
+    print(f"    - Template: {frozen_template_time:.6f}s")
+    print(f"    - Parent: {frozen_parent_time:.6f}s")
+    print(f"  Non-frozen approach: {unfrozen_total_time:.6f}s")
     print()
 
     if frozen_total_time < unfrozen_total_time:
@@ -296,7 +447,7 @@ def main():
         time_saved = unfrozen_total_time - frozen_total_time
         print(f"✓ Frozen approach is FASTER")
         print(f"  Speedup: {speedup:.2f}x")
-        print(f"  Time saved: {time_saved:.4f}s ({100 * time_saved / unfrozen_total_time:.1f}%)")
+        print(f"  Time saved: {time_saved:.6f}s ({100 * time_saved / unfrozen_total_time:.1f}%)")
     else:
         slowdown = frozen_total_time / unfrozen_total_time
         print(f"  Frozen approach is slower by {slowdown:.2f}x")
@@ -315,7 +466,12 @@ def main():
     print("Comparing first 3 block instances:")
     print()
 
-    for i in range(min(3, num_blocks)):
+    shown = min(3, num_blocks)
+    size_matches = ((frozen_pos[:shown, 2:] - frozen_pos[:shown, :2]) ==
+                    (unfrozen_pos[:shown, 2:] - unfrozen_pos[:shown, :2])).all(axis=1)
+    position_matches = (frozen_pos[:shown, :2] == unfrozen_pos[:shown, :2]).all(axis=1)
+
+    for i in range(shown):
         frozen_block = frozen_parent.children[i]
         unfrozen_block = unfrozen_parent.children[i]
 
@@ -323,11 +479,8 @@ def main():
         print(f"  Frozen:    {frozen_block.pos_list} [{frozen_block.name}]")
         print(f"  Non-frozen: {unfrozen_block.pos_list} [{unfrozen_block.name}]")
 
-        fx1, fy1, fx2, fy2 = frozen_block.pos_list
-        ux1, uy1, ux2, uy2 = unfrozen_block.pos_list
-
-        size_match = (fx2-fx1 == ux2-ux1) and (fy2-fy1 == uy2-uy1)
-        position_match = (fx1 == ux1) and (fy1 == uy1)
+        size_match = size_matches[i]
+        position_match = position_matches[i]
 
         if size_match and position_match:
             print(f"  ✓ Identical")
@@ -368,10 +521,21 @@ def main():
     print("  3. Performance benefits increase with design size")
     print()
 
-    print("Files generated:")
-    print(f"  - {frozen_gds} (with frozen cells)")
-    print(f"  - {unfrozen_gds} (without frozen cells)")
-    print()
+    if not skip_export:
+        print("Files generated:")
+        print(f"  - {frozen_gds} (with frozen cells)")
+        print(f"  - {unfrozen_gds} (without frozen cells)")
+        print()
+
+    if json_out:
+        metrics.update({
+            'unfrozen_total_time_s': unfrozen_total_time,
+            'unfrozen_wall_time_s': unfrozen_wall_time,
+            'unfrozen_cells': unfrozen_cells_count,
+            'layouts_match': layouts_match,
+        })
+        _write_metrics(json_out, metrics)
+        print()
 
     print("=" * 80)
 
@@ -380,5 +544,41 @@ def main():
 
 
 if __name__ == '__main__':
-    success = main()
+    parser = argparse.ArgumentParser(description='Frozen vs non-frozen layout comparison')
+    parser.add_argument('--num-blocks', type=int, default=10,
+                        help='Number of block instances (default: 10)')
+    parser.add_argument('--layers-per-block', type=int, default=20,
+                        help='Number of layer rectangles per block (default: 20)')
+    parser.add_argument('--frozen-only', action='store_true',
+                        help='Only build and time the frozen hierarchy')
+    parser.add_argument('--skip-export', action='store_true',
+                        help='Skip GDS export and hierarchy tree printing')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Build both hierarchies at once in worker processes '
+                             '(faster, but solve times are less comparable)')
+    parser.add_argument('--json-out', metavar='PATH',
+                        help='Also write timings, cell counts and the comparison '
+                             'result to a JSON file')
+    args = parser.parse_args()
+
+    if args.num_blocks < 1 or args.layers_per_block < 1:
+        parser.error('--num-blocks and --layers-per-block must be at least 1')
+    # The solver's coordinates are bounded by COORD_MAX, so the row of blocks must fit
+    row_width = block_pitch(args.layers_per_block) * args.num_blocks
+    if row_width > COORD_MAX:
+        parser.error(f'{args.num_blocks} blocks of {args.layers_per_block} layers need '
+                     f'{row_width} units, more than COORD_MAX ({COORD_MAX}); '
+                     f'use fewer blocks or fewer layers per block')
+
+    # Collect the whole report (including solver and export messages) in
+    # memory and write it once, so no terminal I/O lands in timed regions
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            success = main(num_blocks=args.num_blocks,
+                           layers_per_block=args.layers_per_block,
+                           frozen_only=args.frozen_only, skip_export=args.skip_export,
+                           parallel=args.parallel, json_out=args.json_out)
+    finally:
+        sys.stdout.write(report.getvalue())
     sys.exit(0 if success else 1)
@@ -15,8 +15,13 @@ Tests:
 10. import_gds_to_cell with frozen cells
 """
 
+import argparse
+import io
 import os
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -519,10 +524,11 @@ def test_solver_optimization():
     # Create a complex block with many children
     complex_block = Cell('complex_block')
 
-    # Add 20 children to make it complex
-    for i in range(20):
-        layer = Cell(f'layer_{i}', 'metal1')
-        complex_block.constrain(layer, f'x1={i*2}, y1=0, x2={i*2+2}, y2=10')
+    # Add 20 children to make it complex (one batched call)
+    complex_block.constrain_many([
+        (Cell(f'layer_{i}', 'metal1'), f'x1={i*2}, y1=0, x2={i*2+2}, y2=10')
+        for i in range(20)
+    ])
 
     print(f"✓ Created complex block with {len(complex_block.children)} children")
 
@@ -555,10 +561,10 @@ def test_solver_optimization():
     parent = Cell('parent_with_frozen')
 
     # Add multiple instances of frozen block
-    for i in range(10):
-        inst = complex_block.copy()
-        parent.add_instance(inst)
-        parent.constrain(inst, f'x1={i*50}, y1=0, x2={i*50+40}, y2=10')
+    parent.constrain_many([
+        (complex_block.copy(), f'x1={i*50}, y1=0, x2={i*50+40}, y2=10')
+        for i in range(10)
+    ])
 
     print(f"Created parent with {len(parent.children)} frozen block instances")
     print(f"  Without freezing, solver would need to handle: {len(parent.children)} × {len(complex_block.children)} = {len(parent.children) * len(complex_block.children)} child cells")
@@ -677,7 +683,35 @@ def test_frozen_with_import_gds():
 # MAIN TEST RUNNER
 # ==============================================================================
 
-def main():
+def run_test(test_name, test_func):
+    """Run one test, returning its result (exceptions count as failures)"""
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"✗ TEST FAILED WITH EXCEPTION: {test_name}")
+        print(f"  Exception: {e}")
+        traceback.print_exc(file=sys.stdout)
+        print()
+        return False
+
+
+def _run_test_captured(test_name, test_func):
+    """Run one test with its output captured, returning (result, captured output)"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        result = run_test(test_name, test_func)
+    return result, buffer.getvalue()
+
+
+def main(parallel=False):
+    """
+    Run all tests and print a summary
+
+    Args:
+        parallel: Run the tests in worker processes (they share no state and
+                  write distinct files); each test's output is still printed
+                  in order once it finishes
+    """
     print()
     print("*" * 80)
     print("COMPREHENSIVE FROZEN LAYOUT FEATURE TEST SUITE")
@@ -700,17 +734,22 @@ def main():
 
     results = []
 
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
+    if parallel:
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(_run_test_captured, test_name, test_func)
+                       for test_name, test_func in tests]
+            for (test_name, _), future in zip(tests, futures):
+                result, output = future.result()
+                sys.stdout.write(output)
+                results.append((test_name, result))
+    else:
+        # Buffer each test's report and write it once the test finishes,
+        # rather than one terminal write per print()
+        for test_name, test_func in tests:
+            result, output = _run_test_captured(test_name, test_func)
+            sys.stdout.write(output)
+            sys.stdout.flush()
             results.append((test_name, result))
-        except Exception as e:
-            print(f"✗ TEST FAILED WITH EXCEPTION: {test_name}")
-            print(f"  Exception: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((test_name, False))
-            print()
 
     # Summary
     print()
@@ -742,5 +781,10 @@ def main():
 
 
 if __name__ == '__main__':
-    success = main()
+    parser = argparse.ArgumentParser(description='Comprehensive frozen layout tests')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run the tests in worker processes')
+    args = parser.parse_args()
+
+    success = main(parallel=args.parallel)
     sys.exit(0 if success else 1)
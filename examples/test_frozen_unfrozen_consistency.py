@@ -90,21 +90,23 @@ def test_frozen_unfrozen_consistency():
     print("   ✓ Solved successfully with block_b frozen")
 
     # 6. Save positions BEFORE unfreezing (the "before" state)
-    def collect_all_positions(cell, prefix=""):
-        """Recursively collect ALL polygon/instance positions"""
+    def collect_all_positions(cell):
+        """Collect ALL polygon/instance positions (explicit stack, one dict)"""
         positions = {}
-        for child in cell.children:
+        # Children are pushed reversed so they are visited in order
+        stack = [(child, "") for child in reversed(cell.children)]
+        while stack:
+            child, prefix = stack.pop()
             child_name = f"{prefix}{child.name}"
-            if hasattr(child, 'pos_list') and child.pos_list:
-                positions[child_name] = tuple(child.pos_list)
-            # Recursively collect positions from child cells (even if frozen)
-            if hasattr(child, 'children'):
-                # For frozen cells, still collect their positions for comparison
-                if not child.is_frozen():
-                    positions.update(collect_all_positions(child, f"{child_name}."))
-                else:
-                    # For frozen cells, just note they are frozen
-                    positions[f"{child_name}.__frozen__"] = child.get_bbox()
+            pos = child.pos_list
+            if pos:
+                positions[child_name] = tuple(pos)
+            # Descend into child cells
+            if not child.is_frozen():
+                stack.extend((grandchild, f"{child_name}.") for grandchild in reversed(child.children))
+            else:
+                # For frozen cells, just note they are frozen
+                positions[f"{child_name}.__frozen__"] = child.get_bbox()
         return positions
 
     # 7. Collect positions with block_b frozen ("before")
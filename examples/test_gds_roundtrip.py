@@ -9,18 +9,35 @@ Verifies that:
 4. Positions and layers are preserved
 """
 
+import argparse
 import os
 import sys
+from operator import attrgetter
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from layout_automation.cell import Cell
 import gdstk
+import numpy as np
 
 # Create output directory
 os.makedirs('demo_outputs', exist_ok=True)
 
+# Parsed GDS libraries keyed by (path, mtime, size), so the comparison and the
+# detailed listing below read each file only once (a rewritten file is re-read)
+_GDS_CACHE = {}
+
+
+def _read_gds_cached(path):
+    """Read a GDS file with gdstk, reusing the library if the file is unchanged"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    lib = _GDS_CACHE.get(key)
+    if lib is None:
+        lib = _GDS_CACHE[key] = gdstk.read_gds(path)
+    return lib
+
 
 def create_test_layout(name):
     """Create a test layout with hierarchy"""
@@ -37,11 +54,13 @@ def create_test_layout(name):
     top.add_instance([metal1_a, metal1_b, poly, diff, contact])
 
     # Add constraints
-    top.constrain(metal1_a, 'x1=0, y1=0, x2=20, y2=10')
-    top.constrain(metal1_b, 'x1=25, y1=0, x2=45, y2=10')
-    top.constrain(poly, 'x1=10, y1=5, x2=15, y2=25')
-    top.constrain(diff, 'x1=5, y1=12, x2=40, y2=20')
-    top.constrain(contact, 'x1=12, y1=8, x2=14, y2=12')
+    top.constrain_many([
+        (metal1_a, 'x1=0, y1=0, x2=20, y2=10'),
+        (metal1_b, 'x1=25, y1=0, x2=45, y2=10'),
+        (poly, 'x1=10, y1=5, x2=15, y2=25'),
+        (diff, 'x1=5, y1=12, x2=40, y2=20'),
+        (contact, 'x1=12, y1=8, x2=14, y2=12'),
+    ])
 
     # Solve
     if not top.solver():
@@ -57,8 +76,8 @@ def compare_gds_files(file1, file2):
     Returns:
         (bool, str): (files_match, difference_message)
     """
-    lib1 = gdstk.read_gds(file1)
-    lib2 = gdstk.read_gds(file2)
+    lib1 = _read_gds_cached(file1)
+    lib2 = _read_gds_cached(file2)
 
     differences = []
 
@@ -102,9 +121,11 @@ def compare_gds_files(file1, file2):
                 continue
 
             # Compare coordinates (allow small floating point differences)
-            for j, (p1, p2) in enumerate(zip(points1, points2)):
-                if abs(p1[0] - p2[0]) > 1e-6 or abs(p1[1] - p2[1]) > 1e-6:
-                    differences.append(f"Cell '{cell_name}', polygon {i}, point {j}: ({p1[0]},{p1[1]}) vs ({p2[0]},{p2[1]})")
+            # in one array operation; only differing points are reported
+            mismatched = np.flatnonzero((np.abs(points1 - points2) > 1e-6).any(axis=1))
+            for j in mismatched:
+                p1, p2 = points1[j], points2[j]
+                differences.append(f"Cell '{cell_name}', polygon {i}, point {j}: ({p1[0]},{p1[1]}) vs ({p2[0]},{p2[1]})")
 
         # Compare references (cell instances)
         if len(cell1.references) != len(cell2.references):
@@ -117,38 +138,40 @@ def compare_gds_files(file1, file2):
 
 
 def compare_cell_hierarchies(cell1, cell2):
-    """Compare two Cell hierarchies"""
+    """Compare two Cell hierarchies (depth-first, with an explicit stack)"""
     differences = []
+    stack = [(cell1, cell2)]
 
-    # Compare names
-    if cell1.name != cell2.name:
-        differences.append(f"Different names: {cell1.name} vs {cell2.name}")
+    while stack:
+        cell1, cell2 = stack.pop()
 
-    # Compare positions
-    if cell1.pos_list != cell2.pos_list:
-        differences.append(f"Cell '{cell1.name}': different positions: {cell1.pos_list} vs {cell2.pos_list}")
+        # Compare names
+        if cell1.name != cell2.name:
+            differences.append(f"Different names: {cell1.name} vs {cell2.name}")
 
-    # Compare layers
-    if cell1.layer_name != cell2.layer_name:
-        differences.append(f"Cell '{cell1.name}': different layers: {cell1.layer_name} vs {cell2.layer_name}")
+        # Compare positions
+        if cell1.pos_list != cell2.pos_list:
+            differences.append(f"Cell '{cell1.name}': different positions: {cell1.pos_list} vs {cell2.pos_list}")
 
-    # Compare number of children
-    if len(cell1.children) != len(cell2.children):
-        differences.append(f"Cell '{cell1.name}': different child count: {len(cell1.children)} vs {len(cell2.children)}")
-        return False, "\n".join(differences)
+        # Compare layers
+        if cell1.layer_name != cell2.layer_name:
+            differences.append(f"Cell '{cell1.name}': different layers: {cell1.layer_name} vs {cell2.layer_name}")
 
-    # Recursively compare children (by name since order might differ)
-    children1_dict = {c.name: c for c in cell1.children}
-    children2_dict = {c.name: c for c in cell2.children}
+        # Compare number of children
+        if len(cell1.children) != len(cell2.children):
+            differences.append(f"Cell '{cell1.name}': different child count: {len(cell1.children)} vs {len(cell2.children)}")
+            continue
 
-    if set(children1_dict.keys()) != set(children2_dict.keys()):
-        differences.append(f"Cell '{cell1.name}': different child names")
-        return False, "\n".join(differences)
+        # Compare children (sorted by name since order might differ)
+        children1 = sorted(cell1.children, key=attrgetter('name'))
+        children2 = sorted(cell2.children, key=attrgetter('name'))
 
-    for child_name in children1_dict:
-        match, msg = compare_cell_hierarchies(children1_dict[child_name], children2_dict[child_name])
-        if not match:
-            differences.append(msg)
+        if any(c1.name != c2.name for c1, c2 in zip(children1, children2)):
+            differences.append(f"Cell '{cell1.name}': different child names")
+            continue
+
+        # Pushed in reverse so children are compared in name order
+        stack.extend(zip(reversed(children1), reversed(children2)))
 
     if differences:
         return False, "\n".join(differences)
@@ -156,7 +179,14 @@ def compare_cell_hierarchies(cell1, cell2):
     return True, "Cell hierarchies are identical"
 
 
-def main():
+def main(verbose=False):
+    """
+    Run the round-trip test
+
+    Args:
+        verbose: Always print the per-polygon listing of STEP 7 (by default
+                 it is only printed when the GDS files differ)
+    """
     print("=" * 80)
     print("GDS ROUND-TRIP TEST")
     print("=" * 80)
@@ -199,12 +229,12 @@ def main():
     print(f"✓ Exported to: {original_gds}")
 
     # Check file exists and has size
-    if os.path.exists(original_gds):
-        size = os.path.getsize(original_gds)
-        print(f"  File size: {size} bytes")
-    else:
+    try:
+        size = os.stat(original_gds).st_size
+    except FileNotFoundError:
         print("✗ Export failed - file not created")
         return False
+    print(f"  File size: {size} bytes")
     print()
 
     # ==============================================================================
@@ -256,12 +286,12 @@ def main():
     imported.export_gds(reexported_gds)
     print(f"✓ Re-exported to: {reexported_gds}")
 
-    if os.path.exists(reexported_gds):
-        size = os.path.getsize(reexported_gds)
-        print(f"  File size: {size} bytes")
-    else:
+    try:
+        size = os.stat(reexported_gds).st_size
+    except FileNotFoundError:
         print("✗ Re-export failed - file not created")
         return False
+    print(f"  File size: {size} bytes")
     print()
 
     # ==============================================================================
@@ -291,30 +321,32 @@ def main():
     # ==============================================================================
     # STEP 7: Detailed comparison
     # ==============================================================================
-    print("=" * 80)
-    print("STEP 7: Detailed Comparison")
-    print("=" * 80)
-    print()
-
-    # Read both GDS files and show details
-    lib1 = gdstk.read_gds(original_gds)
-    lib2 = gdstk.read_gds(reexported_gds)
-
-    print("Original GDS:")
-    for cell in lib1.cells:
-        print(f"  Cell: {cell.name}")
-        print(f"    Polygons: {len(cell.polygons)}")
-        for i, poly in enumerate(cell.polygons):
-            print(f"      {i}: layer=({poly.layer},{poly.datatype}), points={len(poly.points)}")
-    print()
-
-    print("Re-exported GDS:")
-    for cell in lib2.cells:
-        print(f"  Cell: {cell.name}")
-        print(f"    Polygons: {len(cell.polygons)}")
-        for i, poly in enumerate(cell.polygons):
-            print(f"      {i}: layer=({poly.layer},{poly.datatype}), points={len(poly.points)}")
-    print()
+    # Only needed to track down differences (or when asked for)
+    if verbose or not gds_match:
+        print("=" * 80)
+        print("STEP 7: Detailed Comparison")
+        print("=" * 80)
+        print()
+
+        # Read both GDS files and show details
+        lib1 = _read_gds_cached(original_gds)
+        lib2 = _read_gds_cached(reexported_gds)
+
+        print("Original GDS:")
+        for cell in lib1.cells:
+            print(f"  Cell: {cell.name}")
+            print(f"    Polygons: {len(cell.polygons)}")
+            for i, poly in enumerate(cell.polygons):
+                print(f"      {i}: layer=({poly.layer},{poly.datatype}), points={len(poly.points)}")
+        print()
+
+        print("Re-exported GDS:")
+        for cell in lib2.cells:
+            print(f"  Cell: {cell.name}")
+            print(f"    Polygons: {len(cell.polygons)}")
+            for i, poly in enumerate(cell.polygons):
+                print(f"      {i}: layer=({poly.layer},{poly.datatype}), points={len(poly.points)}")
+        print()
 
     # ==============================================================================
     # STEP 8: Test with import_gds_to_cell
@@ -388,5 +420,9 @@ def main():
 
 
 if __name__ == '__main__':
-    success = main()
+    parser = argparse.ArgumentParser(description='GDS round-trip test')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print the per-polygon GDS listing even when the files match')
+    args = parser.parse_args()
+    success = main(verbose=args.verbose)
     sys.exit(0 if success else 1)
@@ -44,12 +44,14 @@ contact2 = Cell('contact2', 'contact')
 original.add_instance([diff_layer, poly_gate, metal1, metal2, contact1, contact2])
 
 # Add constraints for original positions
-original.constrain(diff_layer, 'x1=0, y1=10, x2=50, y2=30')
-original.constrain(poly_gate, 'x1=20, y1=5, x2=30, y2=35')
-original.constrain(metal1, 'x1=5, y1=15, x2=18, y2=25')
-original.constrain(metal2, 'x1=32, y1=15, x2=45, y2=25')
-original.constrain(contact1, 'x1=8, y1=18, x2=12, y2=22')
-original.constrain(contact2, 'x1=38, y1=18, x2=42, y2=22')
+original.constrain_many([
+    (diff_layer, 'x1=0, y1=10, x2=50, y2=30'),
+    (poly_gate, 'x1=20, y1=5, x2=30, y2=35'),
+    (metal1, 'x1=5, y1=15, x2=18, y2=25'),
+    (metal2, 'x1=32, y1=15, x2=45, y2=25'),
+    (contact1, 'x1=8, y1=18, x2=12, y2=22'),
+    (contact2, 'x1=38, y1=18, x2=42, y2=22'),
+])
 
 # Solve and export
 if original.solver():
@@ -8,6 +8,8 @@ Supports hierarchical cell instances with constraint solving using OR-Tools
 from __future__ import annotations
 import re
 import copy as copy_module
+import threading
+from functools import lru_cache
 from typing import List, Union, Tuple, Dict, Optional
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
@@ -41,6 +43,175 @@ else:
     pass
 
 
+# Coordinate bounds for solver variables
+COORD_MIN = 0
+COORD_MAX = 10000
+
+# Variable name -> slot in the 8-entry [s_x1, s_y1, s_x2, s_y2, o_x1, o_y1, o_x2, o_y2]
+# variable list. Absolute constraints accept both 'x' and 's' prefixes for the cell.
+_ABSOLUTE_SLOTS = {
+    'x1': 0, 'y1': 1, 'x2': 2, 'y2': 3,
+    'sx1': 0, 'sy1': 1, 'sx2': 2, 'sy2': 3,
+}
+_RELATIVE_SLOTS = {
+    'sx1': 0, 'sy1': 1, 'sx2': 2, 'sy2': 3,
+    'ox1': 4, 'oy1': 5, 'ox2': 6, 'oy2': 7,
+}
+
+_TOKEN_RE = re.compile(r'[soxy][xy]?[12]|\d+\.?\d*|[+\-*/()]')
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+_SIGNED_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
+# Compiled constraint strings are memoized by _compile_template(), keyed by
+# (constraint_str, is_relative). Constraint strings are mostly reused templates
+# ('sx2+10<ox1', 'swidth=10', ...), so each is tokenized once while it stays
+# among the most recently used. Literal-only placements ('x1=100, y1=50') are
+# compiled directly and never stored.
+_TEMPLATE_CACHE_SIZE = 2048
+
+
+def _compile_expression(expr_str: str, slot_map: Dict[str, int]) -> Tuple[tuple, float]:
+    """
+    Compile an arithmetic expression into sparse (slot, coefficient) terms
+
+    Uses the same token rules as Cell._parse_expression_to_coeffs, but the
+    result only refers to variable slots, so it can be reused for any cells.
+
+    Args:
+        expr_str: Expression string like 'sx1+5' or 'ox2*2-3' or 'sx2-sx1'
+        slot_map: Mapping of variable names to slots (0-7)
+
+    Returns:
+        Tuple of (((slot, coeff), ...) sorted by slot, constant term)
+    """
+    coeffs = {}
+    constant = 0.0
+
+    tokens = _TOKEN_RE.findall(expr_str)
+
+    i = 0
+    sign = 1.0
+    pending_coefficient = None
+
+    while i < len(tokens):
+        token = tokens[i]
+
+        if token == '+':
+            sign = 1.0
+            pending_coefficient = None
+        elif token == '-':
+            sign = -1.0
+            pending_coefficient = None
+        elif token == '*':
+            pass
+        elif token in slot_map:
+            coeff = sign
+            if pending_coefficient is not None:
+                coeff *= pending_coefficient
+                pending_coefficient = None
+            if i + 2 < len(tokens) and tokens[i+1] == '*' and _NUMBER_RE.match(tokens[i+2]):
+                coeff *= float(tokens[i+2])
+
+            slot = slot_map[token]
+            coeffs[slot] = coeffs.get(slot, 0.0) + coeff
+            sign = 1.0
+        elif _NUMBER_RE.match(token):
+            num = float(token)
+            if i + 1 < len(tokens) and (tokens[i+1] in slot_map or tokens[i+1] == '*'):
+                pending_coefficient = num
+            else:
+                constant += sign * num
+                sign = 1.0
+                pending_coefficient = None
+
+        i += 1
+
+    terms = tuple((slot, coeffs[slot]) for slot in sorted(coeffs) if coeffs[slot] != 0)
+    return terms, constant
+
+
+def _split_operator(constraint: str) -> Tuple[Optional[str], str, str]:
+    """
+    Split one constraint like 'sx2+10<=ox1' at its comparison operator
+
+    Returns:
+        (operator, left, right) with both sides stripped, or (None, '', '')
+        if there is no operator
+    """
+    for op in ['<=', '>=', '<', '>', '=']:
+        if op in constraint:
+            left, right = constraint.split(op, 1)
+            return op, left.strip(), right.strip()
+    return None, '', ''
+
+
+def _compile_literal_constraint_str(constraint_str: str, slot_map: Dict[str, int]) -> Optional[tuple]:
+    """
+    Compile a string made only of literal placements like 'x1=100, y1=50'
+
+    These strings are nearly all distinct (one per placed instance or imported
+    polygon) and cheap to compile, so they are not kept in the template cache.
+
+    Returns:
+        Compiled tuple as from _compile_constraint_str(), or None if any part
+        is not a single variable compared with a number
+    """
+    compiled_parts = []
+    for constraint in constraint_str.split(','):
+        operator, left, right = _split_operator(constraint.strip())
+        if operator is None or left not in slot_map or not _SIGNED_NUMBER_RE.fullmatch(right):
+            return None
+        compiled_parts.append((operator, ((slot_map[left], 1.0),), 0.0, (), float(right)))
+    return tuple(compiled_parts)
+
+
+def _compile_constraint_str(constraint_str: str, is_relative: bool) -> tuple:
+    """
+    Compile a (keyword-expanded) constraint string, using the template cache
+
+    Literal-only strings skip the cache (see _compile_literal_constraint_str).
+
+    Args:
+        constraint_str: Constraint string like 'sx2+10<ox1, sy1=oy1'
+        is_relative: True if the constraint refers to a second ('o') cell
+
+    Returns:
+        Tuple of (operator, left_terms, left_const, right_terms, right_const)
+        entries, one per comma-separated constraint
+    """
+    slot_map = _RELATIVE_SLOTS if is_relative else _ABSOLUTE_SLOTS
+    compiled = _compile_literal_constraint_str(constraint_str, slot_map)
+    if compiled is not None:
+        return compiled
+    return _compile_template(constraint_str, is_relative)
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile_template(constraint_str: str, is_relative: bool) -> tuple:
+    """Memoized body of _compile_constraint_str() for non-literal strings"""
+    slot_map = _RELATIVE_SLOTS if is_relative else _ABSOLUTE_SLOTS
+    compiled_parts = []
+
+    for constraint in constraint_str.split(','):
+        constraint = constraint.strip()
+
+        # Parse operators: <=, >=, <, >, =
+        operator, left, right = _split_operator(constraint)
+        if operator is None:
+            raise ValueError(f"No valid operator found in constraint: {constraint}")
+
+        # Fast path for the common 'x1=100' form: one variable against a literal
+        if left in slot_map and _NUMBER_RE.fullmatch(right):
+            compiled_parts.append((operator, ((slot_map[left], 1.0),), 0.0, (), float(right)))
+            continue
+
+        left_terms, left_const = _compile_expression(left, slot_map)
+        right_terms, right_const = _compile_expression(right, slot_map)
+        compiled_parts.append((operator, left_terms, left_const, right_terms, right_const))
+
+    return tuple(compiled_parts)
+
+
 class Cell(FreezeMixin):
     """
     Hierarchical cell class with constraint-based positioning
@@ -72,6 +243,7 @@ class Cell(FreezeMixin):
         self._var_indices = None  # Cache for variable indices in optimization vector
         self._fixed = False  # Track if layout is fixed (can reposition while maintaining internal structure)
         self._fixed_offsets = {}  # Store relative offsets of children when fixed
+        self._fixed_plan = None  # Flattened descendant offsets, built lazily from _fixed_offsets
         self._centering_constraints = []  # Track centering constraints with tolerance for soft constraint handling
 
         # Initialize freeze-related attributes from mixin
@@ -81,8 +253,9 @@ class Cell(FreezeMixin):
         for arg in args:
             if isinstance(arg, str):
                 # String argument means this is a leaf cell with a layer name
+                # (interned: GDS import builds many equal names like 'layer_68')
                 self.is_leaf = True
-                self.layer_name = arg
+                self.layer_name = sys.intern(arg)
             elif isinstance(arg, Cell):
                 self.children.append(arg)
                 self.child_dict[arg.name] = arg
@@ -106,10 +279,10 @@ class Cell(FreezeMixin):
             self.children.append(instances)
             self.child_dict[instances.name] = instances
         elif isinstance(instances, list):
-            for c in instances:
-                if isinstance(c, Cell):
-                    self.children.append(c)
-                    self.child_dict[c.name] = c
+            # Bulk path: one extend/update instead of per-child appends
+            cells = [c for c in instances if isinstance(c, Cell)]
+            self.children.extend(cells)
+            self.child_dict.update((c.name, c) for c in cells)
         else:
             raise TypeError("Argument must be Cell instance or list of Cell instances")
 
@@ -159,6 +332,8 @@ class Cell(FreezeMixin):
             cell2 = None
             # Expand keywords in constraint string
             expanded_constraint = expand_constraint_keywords(constraint_str)
+            # Compile now so malformed strings fail here and solver() hits the cache
+            _compile_constraint_str(expanded_constraint, False)
             # For self-constraints, we don't auto-add since self is already the parent
             self.constraints.append((cell1, expanded_constraint, cell2))
             return self
@@ -173,13 +348,40 @@ class Cell(FreezeMixin):
         # Auto-add instances to children if not already present
         # This allows users to write: parent.constrain(child1, ..., child2)
         # without explicitly calling parent.add_instance(child1) first
-        if cell1 != self and cell1 not in self.children:
+        # (child_dict lookup first; the list scan only runs for new or renamed cells)
+        if (cell1 is not self and self.child_dict.get(cell1.name) is not cell1
+                and cell1 not in self.children):
             self.add_instance(cell1)
 
-        if cell2 is not None and cell2 != self and cell2 not in self.children:
+        if (cell2 is not None and cell2 is not self and self.child_dict.get(cell2.name) is not cell2
+                and cell2 not in self.children):
             self.add_instance(cell2)
 
         # Check if this is a centering constraint that should use soft constraint with tolerance
+        centering, expanded_constraint = self._split_centering(cell1, constraint_str, cell2)
+        if centering is not None:
+            self._centering_constraints.append(centering)
+        if expanded_constraint is not None:
+            self.constraints.append((cell1, expanded_constraint, cell2))
+
+        return self
+
+    @staticmethod
+    def _split_centering(cell1: 'Cell', constraint_str: str,
+                         cell2: Optional['Cell']) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Separate centering keywords from the rest of a constraint string
+
+        Args:
+            cell1: First cell of the constraint
+            constraint_str: Constraint string as passed to constrain()
+            cell2: Reference cell, or None for absolute/self constraints
+
+        Returns:
+            (centering, expanded_constraint): the soft centering entry for
+            _centering_constraints (or None), and the expanded and compiled
+            remaining constraint string (or None if nothing remains)
+        """
         # Detect keywords: 'center', 'xcenter', 'ycenter'
         # Handle mixed constraints like 'xcenter, sy2=oy1' by extracting centering part
         constraint_lower = constraint_str.lower()
@@ -187,6 +389,7 @@ class Cell(FreezeMixin):
 
         # Separate centering keywords from other constraints
         remaining_constraints = []
+        centering = None
         centering_added = False
 
         if has_centering and cell2 is not None:
@@ -207,13 +410,13 @@ class Cell(FreezeMixin):
                         elif 'center' == part_lower:
                             center_x, center_y = True, True
 
-                        self._centering_constraints.append({
+                        centering = {
                             'child': cell1,
                             'ref_obj': cell2,
                             'tolerance': 1,  # Default tolerance of ±1
                             'center_x': center_x,
                             'center_y': center_y
-                        })
+                        }
                         centering_added = True
                 else:
                     # Not a centering keyword - keep for normal processing
@@ -229,11 +432,104 @@ class Cell(FreezeMixin):
 
             # Expand keywords in constraint string
             expanded_constraint = expand_constraint_keywords(final_constraint_str)
+            _compile_constraint_str(expanded_constraint, cell2 is not None)
+            return centering, expanded_constraint
 
-            self.constraints.append((cell1, expanded_constraint, cell2))
+        return centering, None
+
+    def constrain_many(self, specs: List[Union[str, tuple]]) -> 'Cell':
+        """
+        Add a batch of constraints in one call
+
+        Each spec takes the same arguments as constrain(). Specs are expanded
+        and compiled before any is added, so a malformed spec leaves the cell
+        unchanged, and auto-added instances are added in one batch. The result
+        is the same as calling constrain() for each spec in order, centering
+        keywords included.
+
+        Args:
+            specs: List of constraint specs, each one of:
+                   'x2-x1=100'                    (self-constraint)
+                   (child, 'x1=10, y1=20')        (absolute constraint)
+                   (child1, 'sx2+10=ox1', child2) (relative constraint)
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            >>> block.constrain_many([
+            ...     (rect1, 'x2-x1=10, y2-y1=10'),
+            ...     (rect2, 'sx1=ox2+2, sy1=oy1', rect1),
+            ... ])
+        """
+        staged = []
+        centering = []
+        known = {id(child) for child in self.children}
+        known.add(id(self))
+        new_instances = []
+
+        for spec in specs:
+            if isinstance(spec, str):
+                cell1, constraint_str, cell2 = self, spec, None
+            else:
+                cell1, constraint_str, cell2 = (tuple(spec) + (None,))[:3]
+                if not isinstance(cell1, Cell):
+                    raise TypeError(f"cell1 must be a Cell instance, got {type(cell1)}")
+                if constraint_str is None:
+                    raise ValueError("constraint_str is required when cell1 is a Cell")
+
+            for cell in (cell1, cell2):
+                if cell is not None and id(cell) not in known:
+                    known.add(id(cell))
+                    new_instances.append(cell)
+
+            if isinstance(spec, str):
+                # Self-constraint mode, as in constrain('x2-x1=100')
+                expanded_constraint = expand_constraint_keywords(constraint_str)
+                _compile_constraint_str(expanded_constraint, False)
+                staged.append((cell1, expanded_constraint, cell2))
+                continue
+
+            soft, expanded_constraint = self._split_centering(cell1, constraint_str, cell2)
+            if soft is not None:
+                centering.append(soft)
+            if expanded_constraint is not None:
+                staged.append((cell1, expanded_constraint, cell2))
+
+        if new_instances:
+            self.add_instance(new_instances)
+        self.constraints.extend(staged)
+        self._centering_constraints.extend(centering)
 
         return self
 
+    def add_absolute_position(self, child: 'Cell', x: int, y: int) -> 'Cell':
+        """
+        Pin a child's lower-left corner, same as constrain(child, 'x1=x, y1=y')
+
+        No keyword expansion or validation is done, since the string is built
+        from two numbers. Like any literal-only placement it compiles without
+        going through the template cache. Useful when placing many instances.
+
+        Args:
+            child: Child cell to position (auto-added if needed)
+            x: x1 coordinate
+            y: y1 coordinate
+
+        Returns:
+            Self for method chaining
+        """
+        if not isinstance(child, Cell):
+            raise TypeError(f"child must be a Cell instance, got {type(child)}")
+
+        # child_dict lookup first; the list scan only runs for new or renamed cells
+        if (child is not self and self.child_dict.get(child.name) is not child
+                and child not in self.children):
+            self.add_instance(child)
+
+        self.constraints.append((child, f'x1={x}, y1={y}', None))
+        return self
+
     def center_with_tolerance(self, child: 'Cell', ref_obj: 'Cell' = None, tolerance: float = 0):
         """
         Simple method to center child with tolerance (exact if tolerance=0)
@@ -443,6 +739,29 @@ class Cell(FreezeMixin):
 
         return coeffs, constant
 
+    # Per-thread CP-SAT solver instance and the shape/values of the last solved model.
+    # Consecutive models with the same shape (same cells and constraint structure,
+    # only constants differ) are warm-started with the previous solution as hints.
+    # A CpSolver must not be shared between concurrent Solve() calls, so each
+    # thread keeps its own.
+    _solver_state = threading.local()
+
+    @classmethod
+    def _get_cp_solver(cls) -> 'cp_model.CpSolver':
+        """
+        Get this thread's CP-SAT solver instance, creating it on first use
+
+        Returns:
+            OR-Tools CpSolver instance
+        """
+        state = Cell._solver_state
+        solver = getattr(state, 'cp_solver', None)
+        if solver is None:
+            solver = state.cp_solver = cp_model.CpSolver()
+            state.last_shape = None
+            state.last_values = None
+        return solver
+
     def solver(self, fix_leaf_positions: bool = True, integer_positions: bool = True) -> bool:
         """
         Solve constraints to determine cell positions using OR-Tools CP-SAT solver
@@ -451,6 +770,23 @@ class Cell(FreezeMixin):
             fix_leaf_positions: If True, assigns default positions to leaf cells
             integer_positions: If True, uses integer variables (recommended for OR-Tools)
 
+        Returns:
+            True if solution found, False otherwise
+        """
+        return self._solve(fix_leaf_positions, integer_positions)
+
+    def _solve(self, fix_leaf_positions: bool, integer_positions: bool, quiet: bool = False) -> bool:
+        """
+        Body of solver(); quiet=True suppresses the status messages
+
+        Used for the per-child sub-solves of _try_independent_placement, which
+        would otherwise print one solver status line per child.
+
+        Args:
+            fix_leaf_positions: See solver()
+            integer_positions: See solver()
+            quiet: If True, print nothing
+
         Returns:
             True if solution found, False otherwise
         """
@@ -460,6 +796,14 @@ class Cell(FreezeMixin):
                 "Please install it with: pip install ortools"
             )
 
+        # Fast path: only repositioning fixed/frozen blocks to literal coordinates
+        if self._try_direct_placement():
+            return True
+
+        # Fast path: only pinning independent children to literal coordinates
+        if self._try_independent_placement(fix_leaf_positions, integer_positions):
+            return True
+
         all_cells = self._get_all_cells()
 
         # Create OR-Tools model
@@ -469,9 +813,9 @@ class Cell(FreezeMixin):
         var_counter = {}
         var_objects = {}  # Map from variable index to OR-Tools variable object
 
-        # Define reasonable bounds for coordinates (adjust as needed)
-        coord_min = 0
-        coord_max = 10000
+        # Define reasonable bounds for coordinates (adjust COORD_MIN/COORD_MAX as needed)
+        coord_min = COORD_MIN
+        coord_max = COORD_MAX
 
         for cell in all_cells:
             cell_id = id(cell)
@@ -540,8 +884,9 @@ class Cell(FreezeMixin):
         # Add parent-child bounding constraints
         self._add_parent_child_constraints_ortools(model, var_counter, var_objects)
 
-        # Add all user constraints from the hierarchy
-        self._add_constraints_recursive_ortools(model, var_counter, var_objects)
+        # Add all user constraints from the hierarchy (recording the model shape)
+        constraint_shape = []
+        self._add_constraints_recursive_ortools(model, var_counter, var_objects, constraint_shape)
 
         # Collect all centering constraints from hierarchy
         all_centering_constraints = self._collect_centering_constraints_recursive()
@@ -572,12 +917,28 @@ class Cell(FreezeMixin):
             # No centering constraints, just minimize layout size
             model.Minimize(sum(objective_terms))
 
+        # Warm-start from the previous solve if this model has the same shape
+        model_shape = (
+            fix_leaf_positions,
+            tuple((cell.is_leaf, cell._is_frozen_or_fixed(), len(cell.children)) for cell in all_cells),
+            tuple(constraint_shape),
+            tuple((id(c['child']) in var_counter and id(c['ref_obj']) in var_counter,
+                   c['center_x'], c['center_y']) for c in all_centering_constraints),
+        )
+        solver = self._get_cp_solver()
+        solver_state = Cell._solver_state
+        if model_shape == solver_state.last_shape:
+            for var_idx, value in enumerate(solver_state.last_values):
+                model.AddHint(var_objects[var_idx], value)
+
         # Solve the model
-        solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = 60.0  # Set timeout
         status = solver.Solve(model)
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+            solver_state.last_shape = model_shape
+            solver_state.last_values = [solver.Value(var_objects[i]) for i in range(len(var_objects))]
+
             # Extract solutions
             for cell in all_cells:
                 x1_idx, y1_idx, x2_idx, y2_idx = cell._get_var_indices(var_counter)
@@ -594,16 +955,265 @@ class Cell(FreezeMixin):
             # Update fixed cell positions if any cells are fixed
             self._update_all_fixed_positions()
 
-            if status == cp_model.OPTIMAL:
+            if quiet:
+                pass
+            elif status == cp_model.OPTIMAL:
                 print(f"Optimal solution found in {solver.WallTime():.2f}s")
             else:
                 print(f"Feasible solution found in {solver.WallTime():.2f}s")
 
             return True
         else:
-            print(f"Solver failed with status: {solver.StatusName(status)}")
+            if not quiet:
+                print(f"Solver failed with status: {solver.StatusName(status)}")
+            return False
+
+    def _try_direct_placement(self) -> bool:
+        """
+        Place children directly when their positions are fully determined
+
+        Handles the common "reposition fixed/frozen blocks" case without
+        building a solver model: every constraint on this cell is an absolute
+        literal like 'x1=100, y1=50' on a child. The size of a fixed or frozen
+        child is known (from its frozen bbox or its stored offsets), so its
+        placement is a pure translation; a leaf child must have all four
+        corners given as literals. Either way each position has exactly one
+        solution, the same one the solver would find.
+
+        Returns:
+            True if positions were assigned, False if the full solver is needed
+        """
+        if self.is_leaf or not self.children or self._is_frozen_or_fixed():
+            return False
+        if self._centering_constraints or not self.constraints:
             return False
 
+        # Same size rules, in the same order, as the solver uses
+        sizes = []
+        for child in self.children:
+            if child._frozen and child._frozen_bbox is not None:
+                fx1, fy1, fx2, fy2 = child._frozen_bbox
+                sizes.append((fx2 - fx1, fy2 - fy1))
+            elif child._fixed and len(child._fixed_offsets) > 0:
+                sizes.append((max(offset[2] for offset in child._fixed_offsets.values()),
+                              max(offset[3] for offset in child._fixed_offsets.values())))
+            elif child.is_leaf and not child.constraints and not child._centering_constraints:
+                # Size comes from the literals below (a leaf's own
+                # constraints could contradict them, so those need the solver)
+                sizes.append(None)
+            else:
+                return False
+
+        literals = self._collect_literal_positions()
+        if literals is None:
+            return False
+
+        placements = []
+        for child, size in zip(self.children, sizes):
+            coords = literals.get(id(child))
+            if coords is None or coords[0] is None or coords[1] is None:
+                return False
+
+            if size is None:
+                # Ground leaf rectangle (the solver needs x2 > x1 and y2 > y1)
+                if coords[2] is None or coords[3] is None:
+                    return False
+                x1, y1, x2, y2 = coords
+                if x2 <= x1 or y2 <= y1:
+                    return False
+            else:
+                x1, y1 = coords[0], coords[1]
+                x2, y2 = x1 + size[0], y1 + size[1]
+
+                if coords[2] is not None and coords[2] != x2:
+                    return False
+                if coords[3] is not None and coords[3] != y2:
+                    return False
+            if min(x1, y1) < COORD_MIN or max(x2, y2) > COORD_MAX:
+                return False
+
+            placements.append((child, [x1, y1, x2, y2]))
+
+        for child, pos in placements:
+            child.pos_list = pos
+
+        self.pos_list = [
+            min(pos[0] for _, pos in placements),
+            min(pos[1] for _, pos in placements),
+            max(pos[2] for _, pos in placements),
+            max(pos[3] for _, pos in placements)
+        ]
+        self._update_all_fixed_positions()
+        return True
+
+    def _try_independent_placement(self, fix_leaf_positions: bool, integer_positions: bool) -> bool:
+        """
+        Solve each child on its own when this cell only pins their corners
+
+        Handles arrays of ordinary (not fixed or frozen) blocks placed with
+        'x1=100, y1=50': no constraint links two children, so each child can be
+        solved alone and its subtree translated to the requested x1/y1. Only
+        rigid children are split off this way (see _is_rigid()): their layout
+        is the one solution of their own constraints, so the joint solve has
+        no other choice for them either. A child with any slack (an inequality,
+        a free size) could trade its own size against the parent's bounding
+        box, which only the joint objective sees, so that needs the full solver.
+        If anything fails part way, all positions are restored before falling back.
+
+        Args:
+            fix_leaf_positions: Passed on to the per-child solves (run quietly)
+            integer_positions: Passed on to the per-child solves (run quietly)
+
+        Returns:
+            True if positions were assigned, False if the full solver is needed
+        """
+        if self.is_leaf or len(self.children) < 2 or self._is_frozen_or_fixed():
+            return False
+        if self._centering_constraints or not self.constraints:
+            return False
+
+        literals = self._collect_literal_positions()
+        if literals is None:
+            return False
+
+        targets = []
+        for child in self.children:
+            coords = literals.get(id(child))
+            if coords is None or coords[0] is None or coords[1] is None:
+                return False
+            if coords[2] is not None or coords[3] is not None:
+                return False
+            if child.is_leaf or not child._is_rigid():
+                return False
+            targets.append((child, coords[0], coords[1]))
+
+        # The sub-solves write positions and the warm-start state as they go
+        saved_positions = [(cell, list(cell.pos_list))
+                           for child, _, _ in targets for cell in child._get_all_cells()]
+        solver_state = Cell._solver_state
+        saved_state = (getattr(solver_state, 'last_shape', None),
+                       getattr(solver_state, 'last_values', None))
+
+        subtrees = []
+        for child, x1, y1 in targets:
+            subtree = child._get_all_cells()
+            if child._solve(fix_leaf_positions, integer_positions, quiet=True):
+                dx = x1 - child.pos_list[0]
+                dy = y1 - child.pos_list[1]
+                if (min(c.pos_list[0] for c in subtree) + dx >= COORD_MIN
+                        and min(c.pos_list[1] for c in subtree) + dy >= COORD_MIN
+                        and max(c.pos_list[2] for c in subtree) + dx <= COORD_MAX
+                        and max(c.pos_list[3] for c in subtree) + dy <= COORD_MAX):
+                    subtrees.append((subtree, dx, dy))
+                    continue
+
+            for cell, pos_list in saved_positions:
+                cell.pos_list = pos_list
+            solver_state.last_shape, solver_state.last_values = saved_state
+            return False
+
+        for subtree, dx, dy in subtrees:
+            for cell in subtree:
+                x1, y1, x2, y2 = cell.pos_list
+                cell.pos_list = [x1 + dx, y1 + dy, x2 + dx, y2 + dy]
+
+        self.pos_list = [
+            min(child.pos_list[0] for child in self.children),
+            min(child.pos_list[1] for child in self.children),
+            max(child.pos_list[2] for child in self.children),
+            max(child.pos_list[3] for child in self.children)
+        ]
+
+        return True
+
+    def _collect_literal_positions(self) -> Optional[Dict[int, list]]:
+        """
+        Read this cell's constraints as literal corner coordinates of its children
+
+        Returns:
+            Dict mapping id(child) to [x1, y1, x2, y2] (None where unconstrained),
+            or None if any constraint is not an absolute literal like 'x1=100'
+            on a direct child
+        """
+        children_ids = {id(child) for child in self.children}
+
+        literals = {}
+        for cell1, constraint_str, cell2 in self.constraints:
+            if cell2 is not None or id(cell1) not in children_ids:
+                return None
+            coords = literals.setdefault(id(cell1), [None, None, None, None])
+
+            for operator, left_terms, left_const, right_terms, right_const in \
+                    _compile_constraint_str(constraint_str, False):
+                if operator != '=':
+                    return None
+                # 'x1=100' or '100=x1' (constants truncated as in the solver)
+                if len(left_terms) == 1 and not right_terms and left_terms[0][1] == 1:
+                    slot, value = left_terms[0][0], int(right_const) - int(left_const)
+                elif len(right_terms) == 1 and not left_terms and right_terms[0][1] == 1:
+                    slot, value = right_terms[0][0], int(left_const) - int(right_const)
+                else:
+                    return None
+                if coords[slot] is not None and coords[slot] != value:
+                    return None
+                coords[slot] = value
+
+        return literals
+
+    def _is_rigid(self) -> bool:
+        """
+        Check whether this subtree's layout is fully determined up to a translation
+
+        True if no cell in the subtree is frozen or fixed, has centering
+        constraints or is an empty container, and every constraint is an
+        equality between leaves of the subtree with zero net coefficient on x
+        and on y (differences like 'x2-x1=10', 'sx1=ox2+2'). These equalities
+        must pin every leaf corner once one corner is held in place; container
+        boxes then follow as bounding boxes of their leaves.
+
+        Returns:
+            True if the subtree has exactly one layout for each translation
+        """
+        cells = self._get_all_cells()
+        leaf_columns = {}
+        for cell in cells:
+            if cell._is_frozen_or_fixed() or cell._centering_constraints:
+                return False
+            if cell.is_leaf:
+                leaf_columns[id(cell)] = len(leaf_columns) * 4
+            elif not cell.children:
+                return False
+
+        # One row per equality over the leaf corners; the first two rows hold
+        # the first leaf's x1/y1 in place, so full rank means no freedom left
+        rows = [{0: 1.0}, {1: 1.0}]
+        for cell in cells:
+            for cell1, constraint_str, cell2 in cell.constraints:
+                columns = [leaf_columns.get(id(cell1)),
+                           None if cell2 is None else leaf_columns.get(id(cell2))]
+                if columns[0] is None or (cell2 is not None and columns[1] is None):
+                    return False
+                for operator, left_terms, _, right_terms, _ in \
+                        _compile_constraint_str(constraint_str, cell2 is not None):
+                    if operator != '=':
+                        return False
+                    row = {}
+                    net = [0.0, 0.0]
+                    for terms, sign in ((left_terms, 1.0), (right_terms, -1.0)):
+                        for slot, coeff in terms:
+                            column = columns[slot // 4] + slot % 4
+                            row[column] = row.get(column, 0.0) + sign * coeff
+                            net[slot % 2] += sign * coeff
+                    if net != [0.0, 0.0]:
+                        return False
+                    rows.append(row)
+
+        matrix = np.zeros((len(rows), len(leaf_columns) * 4))
+        for i, row in enumerate(rows):
+            for column, coeff in row.items():
+                matrix[i, column] = coeff
+        return np.linalg.matrix_rank(matrix) == matrix.shape[1]
+
     def _get_all_cells(self) -> List['Cell']:
         """
         Get all cells in the hierarchy (recursive)
@@ -617,18 +1227,38 @@ class Cell(FreezeMixin):
         Returns:
             List of all Cell instances including self
         """
-        cells = [self]
+        cells = []
+        # Explicit stack in pre-order (children pushed reversed), same order
+        # as the recursive walk without building a list per subtree
+        stack = [self]
+        while stack:
+            cell = stack.pop()
+            cells.append(cell)
+            # If this cell is frozen or fixed, don't include its children in solver
+            # Frozen: internal structure is locked
+            # Fixed: will update children via offsets after solving
+            if not cell._is_frozen_or_fixed():
+                stack.extend(reversed(cell.children))
+        return cells
+
+    def count_cells(self) -> int:
+        """
+        Count the cells the solver would see for this hierarchy
 
-        # If this cell is frozen or fixed, don't include its children in solver
-        # Frozen: internal structure is locked
-        # Fixed: will update children via offsets after solving
-        if self._is_frozen_or_fixed():
-            return cells
+        Same as len(self._get_all_cells()) (frozen and fixed cells count as
+        one, their children are not visited) without building the list.
 
-        # Otherwise, recursively collect children
-        for child in self.children:
-            cells.extend(child._get_all_cells())
-        return cells
+        Returns:
+            Number of cells including self
+        """
+        count = 0
+        stack = [self]
+        while stack:
+            cell = stack.pop()
+            count += 1
+            if not cell._is_frozen_or_fixed():
+                stack.extend(cell.children)
+        return count
 
     def _update_parent_bounds(self):
         """
@@ -654,7 +1284,7 @@ class Cell(FreezeMixin):
                 child_y2_vals = []
 
                 for child in cell.children:
-                    if all(v is not None for v in child.pos_list):
+                    if None not in child.pos_list:
                         child_x1_vals.append(child.pos_list[0])
                         child_y1_vals.append(child.pos_list[1])
                         child_x2_vals.append(child.pos_list[2])
@@ -676,7 +1306,7 @@ class Cell(FreezeMixin):
         Returns:
             Tuple of (x1, y1, x2, y2) or None if position not yet determined
         """
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             return tuple(self.pos_list)
         return None
 
@@ -744,7 +1374,8 @@ class Cell(FreezeMixin):
 
     def _add_constraints_recursive_ortools(self, model: cp_model.CpModel,
                                             var_counter: Dict[int, int],
-                                            var_objects: Dict[int, cp_model.IntVar]):
+                                            var_objects: Dict[int, cp_model.IntVar],
+                                            constraint_shape: Optional[List] = None):
         """
         Recursively add all user constraints
 
@@ -752,6 +1383,8 @@ class Cell(FreezeMixin):
             model: OR-Tools CP model
             var_counter: Variable counter dictionary
             var_objects: Dictionary mapping variable indices to OR-Tools variables
+            constraint_shape: Optional list collecting the constant-free structure
+                             of each added constraint (used for solver warm-start)
         """
         # If cell is frozen or fixed, do not process its internal constraints
         # Frozen: treats cell as black box
@@ -761,12 +1394,24 @@ class Cell(FreezeMixin):
 
         # Add constraints from this cell
         for cell1, constraint_str, cell2 in self.constraints:
-            parsed_constraints = self._parse_constraint(constraint_str, cell1, cell2, var_counter)
+            compiled = _compile_constraint_str(constraint_str, cell2 is not None)
 
-            for operator, left_expr, right_expr, var_map in parsed_constraints:
+            # Variable indices for the 8 slots: s_x1..s_y2, then o_x1..o_y2
+            slot_indices = cell1._get_var_indices(var_counter)
+            if cell2 is not None:
+                slot_indices = slot_indices + cell2._get_var_indices(var_counter)
+
+            if constraint_shape is not None:
+                constraint_shape.append((slot_indices, tuple(
+                    (operator, left_terms, right_terms)
+                    for operator, left_terms, _, right_terms, _ in compiled)))
+
+            for operator, left_terms, left_const, right_terms, right_const in compiled:
                 # Build linear expressions for OR-Tools
-                left_linear_expr = self._build_ortools_linear_expr(left_expr, var_map, var_objects)
-                right_linear_expr = self._build_ortools_linear_expr(right_expr, var_map, var_objects)
+                left_linear_expr = self._build_compiled_linear_expr(
+                    left_terms, left_const, slot_indices, var_objects)
+                right_linear_expr = self._build_compiled_linear_expr(
+                    right_terms, right_const, slot_indices, var_objects)
 
                 # Add constraint based on operator
                 if operator == '<':
@@ -782,7 +1427,7 @@ class Cell(FreezeMixin):
 
         # Recursively add constraints from children
         for child in self.children:
-            child._add_constraints_recursive_ortools(model, var_counter, var_objects)
+            child._add_constraints_recursive_ortools(model, var_counter, var_objects, constraint_shape)
 
     def _collect_centering_constraints_recursive(self) -> List[Dict]:
         """
@@ -827,7 +1472,7 @@ class Cell(FreezeMixin):
             List of penalty terms to add to objective
         """
         penalty_terms = []
-        coord_max = 10000
+        coord_max = COORD_MAX
 
         for i, constraint in enumerate(centering_constraints):
             # Skip constraints where child or ref_obj are frozen/fixed
@@ -941,6 +1586,42 @@ class Cell(FreezeMixin):
 
         return linear_expr
 
+    @staticmethod
+    def _build_compiled_linear_expr(terms: tuple, constant: float, slot_indices: Tuple[int, ...],
+                                    var_objects: Dict[int, cp_model.IntVar]):
+        """
+        Build an OR-Tools linear expression from a compiled expression
+
+        Args:
+            terms: Sparse ((slot, coeff), ...) terms from _compile_constraint_str
+            constant: Constant term
+            slot_indices: Variable index for each slot referenced by terms
+            var_objects: Dictionary mapping variable indices to OR-Tools variables
+
+        Returns:
+            Linear expression for OR-Tools
+        """
+        # Merge by variable index (s and o may be the same cell), in index order
+        coeffs = {}
+        for slot, coeff in terms:
+            var_idx = slot_indices[slot]
+            coeffs[var_idx] = coeffs.get(var_idx, 0.0) + coeff
+
+        linear_expr = int(constant)
+
+        for var_idx in sorted(coeffs):
+            coeff = coeffs[var_idx]
+            if coeff != 0:
+                var = var_objects[var_idx]
+                if coeff == 1:
+                    linear_expr += var
+                elif coeff == -1:
+                    linear_expr -= var
+                else:
+                    linear_expr += int(coeff) * var
+
+        return linear_expr
+
     def draw(self, solve_first: bool = True, ax=None, show: bool = True,
              show_labels: bool = True, label_mode: str = 'auto',
              label_position: str = 'top-left'):
@@ -966,7 +1647,7 @@ class Cell(FreezeMixin):
                 - 'center': Center of cell (old behavior)
         """
         # Auto-detect if solving is needed
-        needs_solving = any(v is None for v in self.pos_list)
+        needs_solving = None in self.pos_list
 
         # Solve if needed or explicitly requested
         if needs_solving or solve_first:
@@ -1012,7 +1693,7 @@ class Cell(FreezeMixin):
             child._draw_recursive(ax, level + 1, show_labels, label_mode, label_position)
 
         # Now draw this cell
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             x1, y1, x2, y2 = self.pos_list
             width = x2 - x1
             height = y2 - y1
@@ -1218,6 +1899,9 @@ class Cell(FreezeMixin):
     # Class variable to track copy counts for automatic naming
     _copy_counts = {}
 
+    # Names of the attributes __init__ sets, filled in on first use
+    _init_attributes = None
+
     def copy(self, new_name: str = None) -> 'Cell':
         """
         Create a deep copy of this Cell instance with optional automatic naming
@@ -1238,7 +1922,22 @@ class Cell(FreezeMixin):
             >>> copy2 = block.copy()  # Name: 'reusable_block_c2'
             >>> copy3 = block.copy('custom_name')  # Name: 'custom_name'
         """
-        new_cell = copy_module.deepcopy(self)
+        # Fast path: a plain leaf (no children, constraints, or freeze/fix state)
+        # only needs its layer name, so skip the deepcopy traversal; any
+        # ad-hoc attributes set by callers are still deep-copied
+        cloned = False
+        if (type(self) is Cell and self.is_leaf and not self.children
+                and not self.constraints and not self._centering_constraints
+                and not self._is_frozen_or_fixed()):
+            new_cell = Cell(self.name, self.layer_name)
+            self._copy_extra_attributes(new_cell)
+        elif type(self) is Cell and self._is_frozen_or_fixed():
+            # Fixed and frozen blocks are typically stamped out many times;
+            # clone the structure directly instead of a generic deepcopy
+            new_cell = self._clone_tree(reset_positions=self._fixed)
+            cloned = True
+        else:
+            new_cell = copy_module.deepcopy(self)
 
         # Handle naming
         if new_name is not None:
@@ -1260,11 +1959,14 @@ class Cell(FreezeMixin):
             new_cell.name = f"{original_name}_c{copy_num}"
 
         # Reset variable indices for the new copy and all descendants
-        self._reset_var_indices_recursive(new_cell)
+        # (_clone_tree has already reset them while cloning)
+        if not cloned:
+            self._reset_var_indices_recursive(new_cell)
 
         # For fixed cells, we need to reset ALL positions (including children)
         # Otherwise there's a mismatch: parent has None but children have positions
-        if new_cell._fixed:
+        # (_clone_tree already returns reset positions and remapped offsets)
+        if new_cell._fixed and not cloned:
             # Reset parent position
             new_cell.pos_list = [None, None, None, None]
             # Reset all children positions recursively
@@ -1281,6 +1983,90 @@ class Cell(FreezeMixin):
 
         return new_cell
 
+    def _clone_tree(self, reset_positions: bool = True) -> 'Cell':
+        """
+        Clone a fixed or frozen cell hierarchy without going through deepcopy
+
+        Each cell is shallow-copied, so names, layers, constraint strings,
+        offset tuples and frozen bboxes (all immutable) are shared with the
+        original. The per-instance containers are rebuilt: children,
+        child_dict, constraints and centering constraints point at the cloned
+        cells, _fixed_offsets is re-keyed by the cloned children's ids, and
+        every cell gets its own pos_list. Attributes set by callers rather
+        than __init__ are deep-copied, as copy() promises.
+
+        Args:
+            reset_positions: If True, all positions are reset (fixed cells are
+                             placed again from their offsets); if False, the
+                             cloned cells keep copies of the original positions
+                             (frozen cells keep their internal layout)
+
+        Returns:
+            New Cell hierarchy
+        """
+        clones = {}  # id(original cell) -> cloned cell
+        pairs = []  # (original cell, cloned cell) in creation order
+
+        def clone(cell):
+            new = clones.get(id(cell))
+            if new is None:
+                # Shallow copy of the instance dict (what copy.copy() does for
+                # Cell, minus the __reduce_ex__ round trip)
+                new = object.__new__(type(cell))
+                new.__dict__.update(cell.__dict__)
+                clones[id(cell)] = new
+                pairs.append((cell, new))
+                new.children = [clone(child) for child in cell.children]
+            return new
+
+        def mapped(cell):
+            return clones.get(id(cell), cell) if cell is not None else None
+
+        new_root = clone(self)
+        for cell, new in pairs:
+            new.pos_list = [None, None, None, None] if reset_positions else list(cell.pos_list)
+            new._var_indices = None
+            new._fixed_plan = None
+            new.child_dict = {name: mapped(child) for name, child in cell.child_dict.items()}
+            new.constraints = [(mapped(c1), constraint_str, mapped(c2))
+                               for c1, constraint_str, c2 in cell.constraints]
+            new._centering_constraints = [
+                dict(c, child=mapped(c['child']), ref_obj=mapped(c['ref_obj']))
+                for c in cell._centering_constraints
+            ]
+            new._fixed_offsets = {id(clones[child_id]): offset
+                                  for child_id, offset in cell._fixed_offsets.items()
+                                  if child_id in clones}
+
+        # The root's flattened offsets carry over, pointing at the cloned cells
+        if self._fixed_plan is not None:
+            new_root._fixed_plan = [(clones[id(cell)], dx1, dy1, dx2, dy2)
+                                    for cell, dx1, dy1, dx2, dy2 in self._fixed_plan
+                                    if id(cell) in clones]
+
+        # Anything else callers attached is deep-copied, with references to
+        # cells of this hierarchy mapped to their clones
+        memo = dict(clones)
+        for cell, new in pairs:
+            cell._copy_extra_attributes(new, memo)
+
+        return new_root
+
+    def _copy_extra_attributes(self, target: 'Cell', memo: Optional[Dict] = None):
+        """
+        Deep-copy the attributes not set by __init__ (e.g. cell.net = {...}) onto target
+
+        Args:
+            target: Cell receiving the copies
+            memo: deepcopy memo dict shared across the cells being copied
+        """
+        if Cell._init_attributes is None:
+            Cell._init_attributes = frozenset(Cell('__init_attributes__').__dict__)
+
+        for key, value in self.__dict__.items():
+            if key not in Cell._init_attributes:
+                target.__dict__[key] = copy_module.deepcopy(value, memo)
+
     def _rebuild_fixed_offsets(self, new_cell: 'Cell', original_cell: 'Cell'):
         """
         Rebuild _fixed_offsets dictionary with new child IDs after deep copy
@@ -1310,6 +2096,7 @@ class Cell(FreezeMixin):
 
         # Replace the offsets dictionary
         new_cell._fixed_offsets = new_offsets
+        new_cell._fixed_plan = None
 
     def _reset_var_indices_recursive(self, cell: 'Cell'):
         """
@@ -1348,7 +2135,7 @@ class Cell(FreezeMixin):
         if frozen_bbox is not None:
             return frozen_bbox
 
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             return tuple(self.pos_list)
 
         return None
@@ -1367,12 +2154,18 @@ class Cell(FreezeMixin):
             >>> cell.constrain('width=100, height=50')
             >>> print(f"Cell width: {cell.width}")  # Auto-solves if needed
         """
+        # A frozen cell's size is fixed by its cached bbox, even for an
+        # unplaced copy, so no solve is needed
+        frozen_bbox = self._get_frozen_bbox()
+        if frozen_bbox is not None:
+            return frozen_bbox[2] - frozen_bbox[0]
+
         # Auto-solve if positions not yet determined
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
 
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             return self.pos_list[2] - self.pos_list[0]
         return None
 
@@ -1390,12 +2183,18 @@ class Cell(FreezeMixin):
             >>> cell.constrain('width=100, height=50')
             >>> print(f"Cell height: {cell.height}")  # Auto-solves if needed
         """
+        # A frozen cell's size is fixed by its cached bbox, even for an
+        # unplaced copy, so no solve is needed
+        frozen_bbox = self._get_frozen_bbox()
+        if frozen_bbox is not None:
+            return frozen_bbox[3] - frozen_bbox[1]
+
         # Auto-solve if positions not yet determined
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
 
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             return self.pos_list[3] - self.pos_list[1]
         return None
 
@@ -1407,10 +2206,10 @@ class Cell(FreezeMixin):
         Returns:
             Left x-coordinate, or None if solver fails
         """
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
-        return self.pos_list[0] if all(v is not None for v in self.pos_list) else None
+        return self.pos_list[0] if None not in self.pos_list else None
 
     @property
     def y1(self) -> Optional[float]:
@@ -1420,10 +2219,10 @@ class Cell(FreezeMixin):
         Returns:
             Bottom y-coordinate, or None if solver fails
         """
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
-        return self.pos_list[1] if all(v is not None for v in self.pos_list) else None
+        return self.pos_list[1] if None not in self.pos_list else None
 
     @property
     def x2(self) -> Optional[float]:
@@ -1433,10 +2232,10 @@ class Cell(FreezeMixin):
         Returns:
             Right x-coordinate, or None if solver fails
         """
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
-        return self.pos_list[2] if all(v is not None for v in self.pos_list) else None
+        return self.pos_list[2] if None not in self.pos_list else None
 
     @property
     def y2(self) -> Optional[float]:
@@ -1446,10 +2245,10 @@ class Cell(FreezeMixin):
         Returns:
             Top y-coordinate, or None if solver fails
         """
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
-        return self.pos_list[3] if all(v is not None for v in self.pos_list) else None
+        return self.pos_list[3] if None not in self.pos_list else None
 
     @property
     def cx(self) -> Optional[float]:
@@ -1466,11 +2265,11 @@ class Cell(FreezeMixin):
             >>> print(f"Center X: {cell.cx}")  # Auto-solves if needed
         """
         # Auto-solve if positions not yet determined
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
 
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             return (self.pos_list[0] + self.pos_list[2]) / 2
         return None
 
@@ -1489,11 +2288,11 @@ class Cell(FreezeMixin):
             >>> print(f"Center Y: {cell.cy}")  # Auto-solves if needed
         """
         # Auto-solve if positions not yet determined
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 return None
 
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             return (self.pos_list[1] + self.pos_list[3]) / 2
         return None
 
@@ -1525,12 +2324,13 @@ class Cell(FreezeMixin):
             return self  # Already fixed
 
         # Solve if not yet solved
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 raise RuntimeError(f"Cannot fix cell '{self.name}': solver failed")
 
         # Mark as fixed
         self._fixed = True
+        self._fixed_plan = None
 
         # Store the original bbox
         parent_x1, parent_y1, parent_x2, parent_y2 = self.pos_list
@@ -1541,7 +2341,7 @@ class Cell(FreezeMixin):
             px1, py1 = parent_origin
 
             for child in cell.children:
-                if all(v is not None for v in child.pos_list):
+                if None not in child.pos_list:
                     # Store offset relative to parent's origin (x1, y1)
                     child_x1, child_y1, child_x2, child_y2 = child.pos_list
                     offset = (
@@ -1561,6 +2361,9 @@ class Cell(FreezeMixin):
 
         store_offsets(self, (parent_x1, parent_y1))
 
+        # Flatten the offsets now so every later move is a single pass
+        self._get_fixed_plan()
+
         print(f"[OK] Cell '{self.name}' fixed with {len(self._fixed_offsets)} relative offsets stored")
         return self
 
@@ -1573,6 +2376,7 @@ class Cell(FreezeMixin):
         """
         self._fixed = False
         self._fixed_offsets = {}
+        self._fixed_plan = None
 
         # Recursively unfix children
         for child in self.children:
@@ -1601,38 +2405,46 @@ class Cell(FreezeMixin):
             return
 
         # Get current parent position
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             return
 
-        parent_x1, parent_y1, parent_x2, parent_y2 = self.pos_list
+        px1, py1 = self.pos_list[0], self.pos_list[1]
 
-        # Update all children positions based on stored offsets
-        def update_children(cell, parent_origin):
-            """Recursively update child positions"""
-            px1, py1 = parent_origin
+        # Every descendant offset is relative to this cell's origin, so moving
+        # the whole block is one flat pass with no recursion
+        for cell, dx1, dy1, dx2, dy2 in self._get_fixed_plan():
+            cell.pos_list = [px1 + dx1, py1 + dy1, px1 + dx2, py1 + dy2]
 
-            for child in cell.children:
-                child_id = id(child)
-                if child_id in cell._fixed_offsets:
-                    dx1, dy1, dx2, dy2 = cell._fixed_offsets[child_id]
-                    child.pos_list = [
-                        px1 + dx1,
-                        py1 + dy1,
-                        px1 + dx2,
-                        py1 + dy2
-                    ]
+    def _get_fixed_plan(self) -> List[Tuple['Cell', float, float, float, float]]:
+        """
+        Flatten the stored offsets of all descendants into one list
 
-                    # Recursively update grandchildren
-                    # If child is fixed, use its update method
-                    # Otherwise, recursively update all its descendants
-                    if not child.is_leaf and len(child.children) > 0:
-                        if child._fixed:
-                            child.update_fixed_positions()
-                        else:
-                            # Not fixed, but still need to update grandchildren
-                            update_children(child, (child.pos_list[0], child.pos_list[1]))
+        Walks the hierarchy once, composing each level's _fixed_offsets into
+        offsets relative to this cell's origin. fix_layout() builds it up
+        front and copy() carries it over to the cloned cells; it is dropped
+        when the layout is unfixed.
+
+        Returns:
+            List of (cell, dx1, dy1, dx2, dy2) in parent-before-child order
+        """
+        if self._fixed_plan is not None:
+            return self._fixed_plan
+
+        plan = []
+        stack = [(self, 0, 0)]
+        while stack:
+            cell, ox, oy = stack.pop()
+            for child in cell.children:
+                offset = cell._fixed_offsets.get(id(child))
+                if offset is None:
+                    continue
+                dx1, dy1, dx2, dy2 = offset
+                plan.append((child, ox + dx1, oy + dy1, ox + dx2, oy + dy2))
+                if not child.is_leaf and len(child.children) > 0:
+                    stack.append((child, ox + dx1, oy + dy1))
 
-        update_children(self, (parent_x1, parent_y1))
+        self._fixed_plan = plan
+        return plan
 
     def _update_all_fixed_positions(self):
         """
@@ -1675,7 +2487,7 @@ class Cell(FreezeMixin):
             print(f"Warning: Cell '{self.name}' is not fixed. Consider using fix_layout() first.")
 
         # Calculate current width and height
-        if all(v is not None for v in self.pos_list):
+        if None not in self.pos_list:
             width = self.pos_list[2] - self.pos_list[0]
             height = self.pos_list[3] - self.pos_list[1]
         else:
@@ -1804,16 +2616,17 @@ class Cell(FreezeMixin):
         gds_cells_dict[cell_id] = gds_cell
 
         # Get this cell's origin for calculating relative positions
-        parent_x1 = self.pos_list[0] if all(v is not None for v in self.pos_list) else 0
-        parent_y1 = self.pos_list[1] if all(v is not None for v in self.pos_list) else 0
+        parent_x1 = self.pos_list[0] if None not in self.pos_list else 0
+        parent_y1 = self.pos_list[1] if None not in self.pos_list else 0
 
-        # Process children
+        # Process children (references are added to the GDS cell in one call)
+        refs = []
         for child in self.children:
             child_id = id(child)
 
             if child.is_leaf:
                 # Leaf cell - create as a separate GDS cell to preserve name
-                if all(v is not None for v in child.pos_list):
+                if None not in child.pos_list:
                     # Create or get the leaf's GDS cell using child object ID
                     if child_id not in gds_cells_dict:
                         # Generate unique GDS name for leaf
@@ -1841,18 +2654,19 @@ class Cell(FreezeMixin):
 
                     # Create reference to the leaf cell at its position RELATIVE to parent
                     x1, y1, _, _ = child.pos_list
-                    ref = gdstk.Reference(leaf_gds_cell, origin=(x1 - parent_x1, y1 - parent_y1))
-                    gds_cell.add(ref)
+                    refs.append(gdstk.Reference(leaf_gds_cell, origin=(x1 - parent_x1, y1 - parent_y1)))
             else:
                 # Non-leaf cell - recursively convert it
                 child_gds_cell = child._convert_to_gds(lib, gds_cells_dict, layer_map, gds_name_counter)
 
-                if all(v is not None for v in child.pos_list):
+                if None not in child.pos_list:
                     x1, y1, _, _ = child.pos_list
 
                     # Create cell reference at position RELATIVE to parent
-                    ref = gdstk.Reference(child_gds_cell, origin=(x1 - parent_x1, y1 - parent_y1))
-                    gds_cell.add(ref)
+                    refs.append(gdstk.Reference(child_gds_cell, origin=(x1 - parent_x1, y1 - parent_y1)))
+
+        if refs:
+            gds_cell.add(*refs)
 
         return gds_cell
 
@@ -2020,7 +2834,7 @@ class Cell(FreezeMixin):
             y2_vals = []
 
             for child in cell.children:
-                if all(v is not None for v in child.pos_list):
+                if None not in child.pos_list:
                     x1_vals.append(child.pos_list[0])
                     y1_vals.append(child.pos_list[1])
                     x2_vals.append(child.pos_list[2])
@@ -2050,7 +2864,7 @@ class Cell(FreezeMixin):
             dx: X offset
             dy: Y offset
         """
-        if all(v is not None for v in cell.pos_list):
+        if None not in cell.pos_list:
             # Convert to int to avoid float issues in solver
             cell.pos_list = [
                 int(round(cell.pos_list[0] + dx)),
@@ -2197,7 +3011,9 @@ class Cell(FreezeMixin):
         """
         cell = cls(gds_cell.name)
 
-        # Process polygons
+        # Process polygons (leaves and their constraints are added in one batch)
+        leaves = []
+        position_specs = []
         for i, polygon in enumerate(gds_cell.polygons):
             layer_key = (polygon.layer, polygon.datatype)
             layer_name = layer_map.get(layer_key, f'layer_{polygon.layer}')
@@ -2210,15 +3026,17 @@ class Cell(FreezeMixin):
             # Create leaf cell for this polygon
             leaf_name = f'{gds_cell.name}_{layer_name}_{i}'
             leaf = cls(leaf_name, layer_name)
-
-            # Add to parent
-            cell.add_instance(leaf)
+            leaves.append(leaf)
 
             if add_constraints:
                 # Store original position as constraint to minimize changes
                 # These constraints will try to keep the element at its original position
                 # but can be overridden by user-added constraints
-                cell.constrain(leaf, f'x1={x1}, y1={y1}, x2={x2}, y2={y2}')
+                position_specs.append((leaf, f'x1={x1}, y1={y1}, x2={x2}, y2={y2}'))
+
+        cell.add_instance(leaves)
+        if position_specs:
+            cell.constrain_many(position_specs)
 
         # Process cell references recursively
         for ref in gds_cell.references:
@@ -2226,10 +3044,10 @@ class Cell(FreezeMixin):
             x_offset, y_offset = ref.origin
 
             # Apply offset to all positions
-            if add_constraints and all(v is not None for v in child_cell.pos_list):
+            if add_constraints and None not in child_cell.pos_list:
                 # Adjust constraints with offset
                 for child in child_cell.children:
-                    if all(v is not None for v in child.pos_list):
+                    if None not in child.pos_list:
                         child.pos_list[0] += x_offset
                         child.pos_list[1] += y_offset
                         child.pos_list[2] += x_offset
@@ -2259,8 +3077,11 @@ class Cell(FreezeMixin):
                 ├── metal (metal1) [0, 0, 20, 20]
                 └── poly (poly) [5, 5, 15, 15]
         """
-        def _tree_recursive(cell, prefix="", is_last=True):
-            lines = []
+        # Walk depth-first with an explicit stack, appending to one line list
+        result_lines = []
+        stack = [(self, "", True)]
+        while stack:
+            cell, prefix, is_last = stack.pop()
 
             # Build cell info string
             info_parts = [cell.name]
@@ -2270,7 +3091,7 @@ class Cell(FreezeMixin):
                 info_parts.append(f"({cell.layer_name})")
 
             # Add position if requested
-            if show_positions and all(v is not None for v in cell.pos_list):
+            if show_positions and None not in cell.pos_list:
                 info_parts.append(f"{cell.pos_list}")
 
             # Add frozen indicator
@@ -2278,15 +3099,16 @@ class Cell(FreezeMixin):
                 info_parts.append("[FROZEN]")
 
             # Create the line for this cell
-            lines.append(prefix + " ".join(info_parts))
+            result_lines.append(prefix + " ".join(info_parts))
+
+            if not cell.children:
+                continue
 
             # Prepare prefix for children
             if prefix == "":
                 # Root level
                 child_prefix_mid = "├── "
                 child_prefix_last = "└── "
-                continuation_mid = "│   "
-                continuation_last = "    "
             else:
                 # Calculate continuation based on whether this is the last child
                 if is_last:
@@ -2296,24 +3118,12 @@ class Cell(FreezeMixin):
 
                 child_prefix_mid = prefix[:-4] + extension + "├── "
                 child_prefix_last = prefix[:-4] + extension + "└── "
-                continuation_mid = prefix[:-4] + extension + "│   "
-                continuation_last = prefix[:-4] + extension + "    "
-
-            # Recursively add children
-            for i, child in enumerate(cell.children):
-                is_last_child = (i == len(cell.children) - 1)
-
-                if is_last_child:
-                    child_tree = _tree_recursive(child, child_prefix_last, True)
-                else:
-                    child_tree = _tree_recursive(child, child_prefix_mid, False)
-
-                lines.extend(child_tree)
 
-            return lines
+            # Push children in reverse so they are visited in order
+            stack.append((cell.children[-1], child_prefix_last, True))
+            for child in reversed(cell.children[:-1]):
+                stack.append((child, child_prefix_mid, False))
 
-        # Generate tree starting from root
-        result_lines = _tree_recursive(self)
         result = '\n'.join(result_lines)
         print(result)
         return result
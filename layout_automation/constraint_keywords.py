@@ -6,6 +6,7 @@ Allows writing: 'xcenter, swidth=10' instead of 'sx1+sx2=ox1+ox2, sx2-sx1=10'
 """
 
 import re
+from functools import lru_cache
 
 # Keyword replacement dictionary
 # Maps keyword → actual constraint string
@@ -56,11 +57,41 @@ CONSTRAINT_KEYWORDS = {
     'oy': 'oy1',              # Object Y (bottom edge)
 }
 
+# Single alternation regex over all keywords, rebuilt if CONSTRAINT_KEYWORDS changes
+_keyword_regex = None
+_keyword_snapshot = None
+
+
+def _get_keyword_regex():
+    """
+    Get the compiled keyword regex, rebuilding it if the keywords changed
+
+    A rebuild also clears the memoized expansions, which were made with the
+    old keywords.
+
+    Returns:
+        Compiled regex matching any keyword as a whole word
+    """
+    global _keyword_regex, _keyword_snapshot
+
+    if CONSTRAINT_KEYWORDS != _keyword_snapshot:
+        # Longest first so e.g. 'xcenter' wins over 'center' and 'swidth' over 'sx'
+        keys = sorted(CONSTRAINT_KEYWORDS, key=len, reverse=True)
+        alternation = '|'.join(re.escape(k) for k in keys)
+        _keyword_regex = re.compile(r'\b(?:' + alternation + r')\b')
+        _keyword_snapshot = dict(CONSTRAINT_KEYWORDS)
+        _expand_cached.cache_clear()
+
+    return _keyword_regex
+
 
 def expand_constraint_keywords(constraint_str):
     """
     Expand constraint keywords to full constraint syntax
 
+    Results are memoized, since the same few constraint strings are expanded
+    over and over. The memo is dropped whenever CONSTRAINT_KEYWORDS changes.
+
     Args:
         constraint_str: Constraint string with keywords
 
@@ -74,20 +105,19 @@ def expand_constraint_keywords(constraint_str):
         'left, swidth=owidth' → 'sx1=ox1, sx2-sx1=ox2-ox1'
         'sx=ox+10, sy=oy' → 'sx1=ox1+10, sy1=oy1'
     """
-    if not constraint_str:
-        return constraint_str
+    _get_keyword_regex()  # drops the memo if CONSTRAINT_KEYWORDS changed
+    return _expand_cached(constraint_str)
 
-    result = constraint_str
 
-    # Replace each keyword with its expansion
-    # Use word boundaries (\b) to avoid replacing parts of other words (e.g., 'sx' in 'sx2')
-    # Sort by length (longest first) to avoid partial replacements (e.g., 'xcenter' before 'center')
-    for keyword in sorted(CONSTRAINT_KEYWORDS.keys(), key=len, reverse=True):
-        replacement = CONSTRAINT_KEYWORDS[keyword]
-        # The pattern looks for the keyword as a whole word.
-        result = re.sub(r'\b' + re.escape(keyword) + r'\b', replacement, result)
+@lru_cache(maxsize=2048)
+def _expand_cached(constraint_str):
+    """Memoized body of expand_constraint_keywords()"""
+    if not constraint_str:
+        return constraint_str
 
-    return result
+    # Replace all keywords in a single pass over the string
+    # Word boundaries (\b) avoid replacing parts of other words (e.g., 'sx' in 'sx2')
+    return _keyword_regex.sub(lambda m: CONSTRAINT_KEYWORDS[m.group(0)], constraint_str)
 
 
 # Create reverse mapping for documentation
@@ -65,7 +65,7 @@ class FreezeMixin:
             return self  # Already frozen
 
         # Solve if not yet solved
-        if any(v is None for v in self.pos_list):
+        if None in self.pos_list:
             if not self.solver():
                 raise RuntimeError(f"Cannot freeze cell '{self.name}': solver failed")
 
@@ -33,6 +33,14 @@ def test_cell_initialization():
     assert container.child_dict["child1"] == child1
     assert container.child_dict["child2"] == child2
 
+def test_layer_name_interned():
+    """Test that equal layer names built at runtime share one string object."""
+    number = 68
+    a = Cell("a", f"layer_{number}")
+    b = Cell("b", "layer_" + str(number))
+    assert a.layer_name == "layer_68"
+    assert a.layer_name is b.layer_name
+
 def test_add_instance():
     """Test adding instances to a cell."""
     parent = Cell("parent")
@@ -92,6 +100,128 @@ def test_relative_constraint():
     assert c[1].replace(" ", "") == "sx2<ox1"
     assert c[2] == child2
 
+def test_compiled_constraint_cache():
+    """Test that constraint strings compile to sparse terms and are cached."""
+    from layout_automation.cell import (
+        _compile_constraint_str, _compile_template, _TEMPLATE_CACHE_SIZE)
+
+    compiled = _compile_constraint_str("sx2+10<=ox1, sx1+sx2=2*ox1-3", True)
+    assert compiled[0] == ("<=", ((2, 1.0),), 10.0, ((4, 1.0),), 0.0)
+    assert compiled[1] == ("=", ((0, 1.0), (2, 1.0)), 0.0, ((4, 2.0),), -3.0)
+    assert _compile_constraint_str("sx2+10<=ox1, sx1+sx2=2*ox1-3", True) is compiled
+    assert _compile_template.cache_info().maxsize == _TEMPLATE_CACHE_SIZE
+
+    # Absolute constraints accept both 'x' and 's' prefixes for the same cell
+    absolute = _compile_constraint_str("x2-sx1=10", False)
+    assert absolute == (("=", ((0, -1.0), (2, 1.0)), 0.0, (), 10.0),)
+
+    # Literal placements compile to single-variable terms, and are not cached
+    # (nearly every placed instance or imported polygon has its own string)
+    cached = _compile_template.cache_info().currsize
+    literal = _compile_constraint_str("x1=30, y2 >= 2.5", False)
+    assert literal == (("=", ((0, 1.0),), 0.0, (), 30.0), (">=", ((3, 1.0),), 0.0, (), 2.5))
+    negative = _compile_constraint_str("x1=-5.0, y1=-2, x2=0.5, y2=4", False)
+    assert negative[0] == ("=", ((0, 1.0),), 0.0, (), -5.0)
+    assert _compile_template.cache_info().currsize == cached
+
+    with pytest.raises(ValueError):
+        _compile_constraint_str("sx1 ox1", True)
+
+def test_keyword_expansion_follows_keyword_changes():
+    """Test that memoized keyword expansion picks up edits to CONSTRAINT_KEYWORDS."""
+    from layout_automation.constraint_keywords import (
+        CONSTRAINT_KEYWORDS, expand_constraint_keywords)
+
+    assert expand_constraint_keywords("left, sgap=5") == "sx1=ox1, sgap=5"
+    CONSTRAINT_KEYWORDS["sgap"] = "sx1-ox2"
+    CONSTRAINT_KEYWORDS["left"] = "sx1=ox1+0"
+    try:
+        assert expand_constraint_keywords("left, sgap=5") == "sx1=ox1+0, sx1-ox2=5"
+    finally:
+        del CONSTRAINT_KEYWORDS["sgap"]
+        CONSTRAINT_KEYWORDS["left"] = "sx1=ox1"
+    assert expand_constraint_keywords("left, sgap=5") == "sx1=ox1, sgap=5"
+
+def test_constrain_compiles_eagerly():
+    """Test that constrain() compiles the expanded string and rejects malformed ones."""
+    from layout_automation.cell import _compile_template
+
+    parent = Cell("parent")
+    a = create_basic_cell("a")
+    b = create_basic_cell("b")
+    parent.constrain(a, "sx2+7=ox1, sy1=oy1", b)
+    hits = _compile_template.cache_info().hits
+    _compile_template("sx2+7=ox1, sy1=oy1", True)
+    assert _compile_template.cache_info().hits == hits + 1
+
+    with pytest.raises(ValueError):
+        parent.constrain(a, "sx1 ox1", b)
+    assert len(parent.constraints) == 1
+
+def test_constrain_many():
+    """Test adding a batch of constraints with constrain_many()."""
+    parent = Cell("parent")
+    a = create_basic_cell("a")
+    b = create_basic_cell("b")
+    c = create_basic_cell("c")
+    parent.constrain_many([
+        "x1=0, y1=0",
+        (a, "width=10, height=10"),
+        (b, "sx1=ox2+5, sy1=oy1", a),
+        (c, "center", b),
+    ])
+
+    assert parent.children == [a, b, c]
+    assert len(parent.constraints) == 3
+    assert parent.constraints[0] == (parent, "x1=0, y1=0", None)
+    assert parent.constraints[2] == (b, "sx1=ox2+5, sy1=oy1", a)
+    assert len(parent._centering_constraints) == 1
+
+    # A malformed spec rejects the whole batch, centering specs included
+    d = create_basic_cell("d")
+    with pytest.raises(ValueError):
+        parent.constrain_many([(d, "xcenter, sy1=oy2", a), (d, "sx1 ox1", a)])
+    assert "d" not in parent.child_dict
+    assert len(parent.constraints) == 3
+    assert len(parent._centering_constraints) == 1
+
+    # Mixed centering specs give the same result as one constrain() per spec
+    results = []
+    for batch in (True, False):
+        top = Cell("top")
+        p = create_basic_cell("p")
+        q = create_basic_cell("q")
+        specs = [(q, "xcenter, sy1=oy2+5", p), (p, "x1=0, y1=0")]
+        if batch:
+            top.constrain_many(specs)
+        else:
+            for spec in specs:
+                top.constrain(*spec)
+        results.append(([(c1.name, s, c2 and c2.name) for c1, s, c2 in top.constraints],
+                        [(e["child"].name, e["center_x"], e["center_y"])
+                         for e in top._centering_constraints]))
+    assert results[0] == results[1]
+    assert results[0][1] == [("q", True, False)]
+
+def test_add_absolute_position():
+    """Test that add_absolute_position() matches constrain(child, 'x1=.., y1=..')."""
+    from layout_automation.cell import _compile_constraint_str, _compile_template
+
+    parent = Cell("parent")
+    child = create_basic_cell("child")
+    cached = _compile_template.cache_info().currsize
+    parent.add_absolute_position(child, 12, 34)
+
+    assert child in parent.children
+    assert parent.constraints == [(child, "x1=12, y1=34", None)]
+
+    # Each placement has its own string, so none is left in the template cache
+    assert _compile_constraint_str("x1=12, y1=34", False) == (
+        ("=", ((0, 1.0),), 0.0, (), 12.0),
+        ("=", ((1, 1.0),), 0.0, (), 34.0),
+    )
+    assert _compile_template.cache_info().currsize == cached
+
 # --- Test Copy Mechanism ---
 
 def test_copy_method():
@@ -128,6 +258,31 @@ def test_copy_method():
     assert len(original.children) == 3
     assert len(custom_copy.children) == 2
 
+def test_copy_leaf_cell():
+    """Test copying a plain leaf cell (fast path without deepcopy)."""
+    leaf = Cell("via_leaf", "via1")
+    leaf.pos_list = [0, 0, 5, 5]
+
+    leaf_copy = leaf.copy()
+    assert leaf_copy.name == "via_leaf_c1"
+    assert leaf_copy.is_leaf
+    assert leaf_copy.layer_name == "via1"
+    assert leaf_copy.pos_list == [None, None, None, None]
+    assert leaf_copy.children == []
+    assert leaf_copy.constraints == []
+
+    # Extra attributes set on the leaf survive the copy (as with deepcopy)
+    leaf.net = {"name": "VDD"}
+    net_copy = leaf.copy()
+    assert net_copy.net == {"name": "VDD"}
+    assert net_copy.net is not leaf.net
+
+    # Leaf with a self-constraint still takes the full copy path
+    leaf.constrain("width=5, height=5")
+    constrained_copy = leaf.copy("constrained")
+    assert len(constrained_copy.constraints) == 1
+    assert constrained_copy.constraints[0][0] is constrained_copy
+
 # --- Test Solver and Layout ---
 
 @pytest.mark.skipif(not HAS_ORTOOLS, reason="OR-Tools is not installed")
@@ -210,6 +365,262 @@ def test_freeze_layout():
     block.unfreeze_layout()
     assert not block.is_frozen()
 
+def test_count_cells():
+    """Test that count_cells matches the solver's cell list."""
+    block = Cell("count_block")
+    m1 = Cell("count_m1", "metal1")
+    m2 = Cell("count_m2", "poly")
+    block.add_instance([m1, m2])
+    m1.pos_list = [0, 0, 10, 10]
+    m2.pos_list = [10, 0, 20, 10]
+    block.pos_list = [0, 0, 20, 10]
+
+    parent = Cell("count_parent")
+    parent.add_instance(block)
+    assert parent.count_cells() == len(parent._get_all_cells()) == 4
+
+    # A frozen block counts as a single cell
+    block.freeze_layout()
+    assert parent.count_cells() == len(parent._get_all_cells()) == 2
+
+def test_copy_frozen_cell():
+    """Test that copying a frozen cell keeps its internal layout in new cells."""
+    block = Cell("frozen_src")
+    m1 = Cell("fs_m1", "metal1")
+    m2 = Cell("fs_m2", "poly")
+    block.constrain(m1, "x1=0, y1=0, x2=10, y2=10")
+    block.constrain(m2, "sx1=ox2+2, sy1=oy1, swidth=5, sheight=10", m1)
+    m1.pos_list = [0, 0, 10, 10]
+    m2.pos_list = [12, 0, 17, 10]
+    block.pos_list = [0, 0, 17, 10]
+    block.freeze_layout()
+
+    dup = block.copy("frozen_dup")
+    assert dup.is_frozen()
+    assert dup._frozen_bbox == (0, 0, 17, 10)
+    assert dup.pos_list == [None, None, None, None]
+    # Size comes from the frozen bbox without solving the unplaced copy
+    assert (dup.width, dup.height) == (17, 10)
+    assert dup.pos_list == [None, None, None, None]
+
+    dup_m1, dup_m2 = dup.children
+    assert dup_m1 is not m1 and dup_m2 is not m2
+    assert dup_m2.pos_list == [12, 0, 17, 10]
+    assert dup.child_dict["fs_m2"] is dup_m2
+    assert dup.constraints[1][0] is dup_m2 and dup.constraints[1][2] is dup_m1
+
+    # The copy's positions are its own
+    dup_m2.pos_list[0] = 99
+    assert m2.pos_list == [12, 0, 17, 10]
+
+    # So are attributes set by callers, on the block and on its children
+    block.tags = ["analog"]
+    m1.net = {"name": "VDD"}
+    tagged = block.copy("frozen_tagged")
+    tagged.tags.append("guarded")
+    tagged.children[0].net["name"] = "VSS"
+    assert block.tags == ["analog"]
+    assert m1.net == {"name": "VDD"}
+
+@pytest.mark.skipif(not HAS_ORTOOLS, reason="OR-Tools is not installed")
+def test_solver_per_thread():
+    """Test that solver() is safe to call from several threads at once."""
+    import threading
+
+    results = {}
+
+    def solve_row(gap):
+        p = Cell(f"row_{gap}")
+        b1 = create_basic_cell("b1")
+        b2 = create_basic_cell("b2")
+        p.constrain(b1, "width=10, height=10, x1=0, y1=0")
+        p.constrain(b2, f"swidth=10, sheight=10, sx1=ox2+{gap}, sy1=oy1", b1)
+        results[gap] = (p.solver(), b2.pos_list[0])
+
+    threads = [threading.Thread(target=solve_row, args=(gap,)) for gap in (1, 2, 3, 4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(results[gap] == (True, 10 + gap) for gap in (1, 2, 3, 4))
+    assert Cell._get_cp_solver() is Cell._get_cp_solver()
+
+@pytest.mark.skipif(not HAS_ORTOOLS, reason="OR-Tools is not installed")
+def test_fixed_block_direct_placement():
+    """Test repositioning fixed blocks with literal coordinates (no solver model)."""
+    block = Cell("fixed_block")
+    r1 = Cell("r1", "metal1")
+    r2 = Cell("r2", "poly")
+    block.constrain(r1, "x1=0, y1=0, x2=10, y2=10")
+    block.constrain(r2, "sx1=ox2+2, sy1=oy1, swidth=5, sheight=10", r1)
+    assert block.solver()
+    block.fix_layout()
+
+    parent = Cell("placement_parent")
+    b1 = block.copy("b1")
+    b2 = block.copy("b2")
+    parent.constrain(b1, "x1=100, y1=50")
+    parent.constrain(b2, "x1=200, y1=50")
+
+    assert parent._try_direct_placement()
+    assert b1.pos_list == [100, 50, 117, 60]
+    assert b2.pos_list == [200, 50, 217, 60]
+    assert b2.children[1].pos_list == [212, 50, 217, 60]
+    assert parent.pos_list == [100, 50, 217, 60]
+
+    # Relative constraints still need the full solver
+    parent.constrain(b2, "sx1=ox2+5", b1)
+    assert not parent._try_direct_placement()
+
+def test_frozen_block_direct_placement():
+    """Test placing frozen blocks with literal coordinates (no solver model)."""
+    block = Cell("frozen_place_block")
+    r1 = Cell("fp_r1", "metal1")
+    r2 = Cell("fp_r2", "poly")
+    block.add_instance([r1, r2])
+    r1.pos_list = [0, 0, 10, 10]
+    r2.pos_list = [12, 0, 17, 10]
+    block.pos_list = [0, 0, 17, 10]
+    block.freeze_layout()
+
+    parent = Cell("frozen_place_parent")
+    b1 = block.copy("fb1")
+    b2 = block.copy("fb2")
+    parent.constrain(b1, "x1=0, y1=0, x2=17, y2=10")
+    parent.constrain(b2, "x1=30, y1=5")
+
+    assert parent._try_direct_placement()
+    assert b1.pos_list == [0, 0, 17, 10]
+    assert b2.pos_list == [30, 5, 47, 15]
+    assert parent.pos_list == [0, 0, 47, 15]
+
+    # A literal x2 that contradicts the frozen size needs the full solver
+    parent.constrain(b1, "x2=20")
+    assert not parent._try_direct_placement()
+
+    # Leaf rectangles with all four corners given are placed directly too
+    rects = Cell("ground_rects")
+    rects.constrain(Cell("gr_a", "metal1"), "x1=0, y1=0, x2=10, y2=10")
+    rects.constrain(Cell("gr_b", "poly"), "x1=12, y1=2, x2=17, y2=8")
+    assert rects._try_direct_placement()
+    assert [c.pos_list for c in rects.children] == [[0, 0, 10, 10], [12, 2, 17, 8]]
+    assert rects.pos_list == [0, 0, 17, 10]
+
+    # ...but not when a leaf corner is left to the solver
+    rects.constrain(Cell("gr_c", "metal1"), "x1=20, y1=0")
+    assert not rects._try_direct_placement()
+
+    # ...nor when a leaf's own constraints contradict the literals
+    bad = Cell("ground_bad")
+    leaf = Cell("gb_a", "metal1")
+    leaf.constrain("x2-x1=10")
+    bad.constrain(leaf, "x1=0, y1=0, x2=5, y2=5")
+    assert not bad._try_direct_placement()
+    assert not bad.solver()
+
+def test_independent_child_placement():
+    """Test solving literally placed, unlinked children one at a time."""
+    def make_block(name):
+        block = Cell(name)
+        r1 = Cell(f"{name}_r1", "metal1")
+        r2 = Cell(f"{name}_r2", "poly")
+        block.constrain(r1, "x2-x1=10, y2-y1=10")
+        block.constrain(r2, "sx1=ox2+2, sy1=oy1, swidth=5, sheight=10", r1)
+        return block
+
+    parent = Cell("independent_parent")
+    b1 = make_block("b1")
+    b2 = make_block("b2")
+    parent.constrain(b1, "x1=100, y1=50")
+    parent.constrain(b2, "x1=200, y1=50")
+
+    assert parent._try_independent_placement(True, True)
+    assert b1.pos_list == [100, 50, 117, 60]
+    assert b2.pos_list == [200, 50, 217, 60]
+    assert b2.children[1].pos_list == [212, 50, 217, 60]
+    assert parent.pos_list == [100, 50, 217, 60]
+
+    # An absolute coordinate inside a child does not survive translation
+    b3 = make_block("b3")
+    b3.constrain(b3.children[0], "x1=5")
+    parent.constrain(b3, "x1=300, y1=50")
+    assert not parent._try_independent_placement(True, True)
+
+    # A child with slack trades its size against the parent's bounding box,
+    # which only the joint solve sees
+    def make_slack_block(name):
+        block = Cell(name)
+        r1 = Cell(f"{name}_r1", "metal1")
+        r2 = Cell(f"{name}_r2", "metal1")
+        block.constrain(r1, "y2-y1=5")
+        block.constrain(r2, "sx1=ox1, 2*sx2-2*sx1+ox2-ox1>=20", r1)
+        block.constrain(r2, "y2-y1=5")
+        return block
+
+    slack_parent = Cell("slack_parent")
+    s1 = make_slack_block("s1")
+    s2 = make_slack_block("s2")
+    slack_parent.constrain(s1, "x1=0, y1=0")
+    slack_parent.constrain(s2, "x1=100, y1=0")
+    assert not slack_parent._try_independent_placement(True, True)
+    assert slack_parent.solver()
+    assert s2.pos_list == [100, 0, 107, 5]
+    assert slack_parent.pos_list == [0, 0, 107, 5]
+
+    # Falling back part way restores the children that were already solved
+    edge_parent = Cell("edge_parent")
+    e1 = make_block("e1")
+    e2 = make_block("e2")
+    edge_parent.constrain(e1, "x1=0, y1=0")
+    edge_parent.constrain(e2, "x1=9990, y1=0")
+    assert not edge_parent._try_independent_placement(True, True)
+    assert all(cell.pos_list == [None, None, None, None]
+               for cell in edge_parent._get_all_cells())
+
+def test_fixed_layout_nested_repositioning():
+    """Test that moving a fixed block updates every level of its hierarchy."""
+    inner = Cell("inner")
+    leaf = Cell("leaf", "metal1")
+    inner.add_instance(leaf)
+    leaf.pos_list = [2, 3, 6, 8]
+    inner.pos_list = [2, 3, 6, 8]
+
+    outer = Cell("outer")
+    pad = Cell("pad", "metal2")
+    outer.add_instance([pad, inner])
+    pad.pos_list = [0, 0, 10, 10]
+    outer.pos_list = [0, 0, 10, 10]
+    outer.fix_layout()
+    assert [entry[0] for entry in outer._fixed_plan] == [pad, inner, leaf]
+
+    outer.set_position(100, 200)
+    assert outer.pos_list == [100, 200, 110, 210]
+    assert pad.pos_list == [100, 200, 110, 210]
+    assert inner.pos_list == [102, 203, 106, 208]
+    assert leaf.pos_list == [102, 203, 106, 208]
+
+    # Offsets survive a copy and apply to the copy's own children
+    outer_copy = outer.copy("outer_copy")
+    assert all(entry[0] is not leaf for entry in outer_copy._fixed_plan)
+    outer_copy.set_position(0, 50)
+    assert outer_copy.child_dict["pad"].pos_list == [0, 50, 10, 60]
+    assert outer_copy.child_dict["inner"].pos_list == [2, 53, 6, 58]
+    assert outer_copy.child_dict["inner"].children[0].pos_list == [2, 53, 6, 58]
+    assert outer_copy.child_dict["inner"].children[0] is not leaf
+    assert leaf.pos_list == [102, 203, 106, 208]
+
+    # Attributes set by callers are deep-copied at every level, and
+    # references to cells of the block point at the copy's cells
+    leaf.net = {"name": "VDD"}
+    outer.pins = [pad]
+    tagged_copy = outer.copy("tagged_copy")
+    copy_leaf = tagged_copy.child_dict["inner"].children[0]
+    copy_leaf.net["name"] = "VSS"
+    assert leaf.net == {"name": "VDD"}
+    assert tagged_copy.pins == [tagged_copy.child_dict["pad"]]
+    assert tagged_copy.pins is not outer.pins
+
 # --- Test GDS Import/Export ---
 
 @pytest.mark.skipif(not HAS_GDS, reason="gdstk is not installed")